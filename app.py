@@ -4,7 +4,7 @@
 """
 
 import streamlit as st
-from pathlib import Path
+from datetime import date
 
 # 페이지 설정 (반드시 첫 번째로 실행)
 st.set_page_config(
@@ -14,22 +14,18 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-from database.connection import init_database, get_session
+from database.connection import DATABASE_PATH, init_database, get_session
 from database.init_db import initialize_all
 from ui.styles import inject_global_css, warning_list_item, styled_alert
-from ui.contract_page import render_contract_page
-from ui.billing_page import render_billing_page
-from ui.outsourcing_page import render_outsourcing_page
-from ui.validation_page import render_validation_page
-from ui.report_page import render_report_page
-from ui.settings_page import render_settings_page
+from ui.sidebar import render_sidebar_summary
 
 
 def check_and_init_database():
-    """데이터베이스 초기화 확인"""
-    db_path = Path(__file__).parent / "data" / "maintenance_billing.db"
+    """데이터베이스 초기화 확인 (세션당 1회)"""
+    if st.session_state.get('_db_ok'):
+        return
 
-    if not db_path.exists():
+    if not DATABASE_PATH.exists():
         with st.spinner("데이터베이스 초기화 중..."):
             initialize_all()
         st.success("데이터베이스가 초기화되었습니다.")
@@ -37,6 +33,8 @@ def check_and_init_database():
         # 테이블 확인
         init_database()
 
+    st.session_state['_db_ok'] = True
+
 
 def main():
     """메인 함수"""
@@ -72,100 +70,75 @@ def main():
     st.sidebar.write("---")
 
     # 현재 상태 요약
-    with get_session() as session:
-        from datetime import date
-        from sqlmodel import select, func
-        from database.models import MonthlyBilling, Contract
-        from utils.constants import BillingStatus, ContractStatus
-
-        today = date.today()
-
-        # 활성 계약 수
-        active_contracts = session.exec(
-            select(func.count(Contract.id)).where(
-                Contract.status.in_([
-                    ContractStatus.ACTIVE.value,
-                    ContractStatus.PERIOD_UNDEFINED.value
-                ])
-            )
-        ).one()
-
-        # 이번 달 청구 수
-        monthly_billings = session.exec(
-            select(func.count(MonthlyBilling.id)).where(
-                MonthlyBilling.billing_year == today.year,
-                MonthlyBilling.billing_month == today.month
-            )
-        ).one()
-
-        # 초안 상태 청구 수
-        draft_billings = session.exec(
-            select(func.count(MonthlyBilling.id)).where(
-                MonthlyBilling.billing_year == today.year,
-                MonthlyBilling.billing_month == today.month,
-                MonthlyBilling.status == BillingStatus.DRAFT.value
-            )
-        ).one()
-
-        st.sidebar.metric("활성 계약", active_contracts)
-        st.sidebar.metric(f"{today.month}월 청구", monthly_billings)
-
-        if draft_billings > 0:
-            st.sidebar.warning(f"미확정: {draft_billings}건")
+    today = date.today()
+    with st.sidebar:
+        render_sidebar_summary(today.year, today.month)
 
-    # 페이지 라우팅
+    # 페이지 라우팅 (페이지 모듈은 선택 시에만 import)
     if menu == "대시보드":
         render_dashboard()
     elif menu == "계약 관리":
+        from ui.contract_page import render_contract_page
         render_contract_page()
     elif menu == "월 청구 생성":
+        from ui.billing_page import render_billing_page
         render_billing_page()
     elif menu == "외주 관리":
+        from ui.outsourcing_page import render_outsourcing_page
         render_outsourcing_page()
     elif menu == "검증/경고":
+        from ui.validation_page import render_validation_page
         render_validation_page()
     elif menu == "보고서":
+        from ui.report_page import render_report_page
         render_report_page()
     elif menu == "설정":
+        from ui.settings_page import render_settings_page
         render_settings_page()
 
 
+@st.fragment(run_every=60)
+def render_dashboard_summary(year: int, month: int):
+    """대시보드 월 요약 (fragment - 페이지 재실행과 분리, 60초마다 갱신)"""
+    from services.calculation_engine import CalculationEngine
+
+    with get_session() as session:
+        calc_engine = CalculationEngine(session)
+        summary = calc_engine.calculate_monthly_summary(year, month)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("청구 건수", summary['count'])
+
+    with col2:
+        st.metric("총 매출", f"{summary['total_billing']:,.0f}원")
+
+    with col3:
+        st.metric("총 외주", f"{summary['total_outsourcing']:,.0f}원")
+
+    with col4:
+        st.metric("총 이익", f"{summary['total_profit']:,.0f}원")
+
+
 def render_dashboard():
     """대시보드"""
     st.header("대시보드")
 
-    from datetime import date
-    from sqlmodel import select
+    from sqlmodel import select, func
     from database.models import MonthlyBilling, Contract
-    from services.calculation_engine import CalculationEngine
     from services.validation_engine import ValidationEngine
-    from utils.constants import BillingStatus, ContractStatus
+    from utils.constants import BILLING_STATUS_VALUES
 
     today = date.today()
 
-    with get_session() as session:
-        # 이번 달 요약
-        st.subheader(f"{today.year}년 {today.month}월 현황")
+    # 이번 달 요약
+    st.subheader(f"{today.year}년 {today.month}월 현황")
+    render_dashboard_summary(today.year, today.month)
 
-        calc_engine = CalculationEngine(session)
+    with get_session() as session:
         validation_engine = ValidationEngine(session)
 
-        summary = calc_engine.calculate_monthly_summary(today.year, today.month)
-
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.metric("청구 건수", summary['count'])
-
-        with col2:
-            st.metric("총 매출", f"{summary['total_billing']:,.0f}원")
-
-        with col3:
-            st.metric("총 외주", f"{summary['total_outsourcing']:,.0f}원")
-
-        with col4:
-            st.metric("총 이익", f"{summary['total_profit']:,.0f}원")
-
         # 경고/누락 현황
         st.write("---")
         col1, col2 = st.columns(2)
@@ -210,22 +183,15 @@ def render_dashboard():
         st.write("---")
         st.subheader("청구 상태별 현황")
 
-        billings = session.exec(
-            select(MonthlyBilling).where(
+        status_rows = session.exec(
+            select(MonthlyBilling.status, func.count()).where(
                 MonthlyBilling.billing_year == today.year,
                 MonthlyBilling.billing_month == today.month
-            )
+            ).group_by(MonthlyBilling.status)
         ).all()
 
-        status_counts = {
-            'draft': 0,
-            'confirmed': 0,
-            'locked': 0,
-            'cancelled': 0
-        }
-
-        for b in billings:
-            status_counts[b.status] = status_counts.get(b.status, 0) + 1
+        status_counts = dict.fromkeys(BILLING_STATUS_VALUES, 0)
+        status_counts.update(status_rows)
 
         col1, col2, col3, col4 = st.columns(4)
 
@@ -1,6 +1,9 @@
 """데이터베이스 연결 및 세션 관리"""
 
 from sqlmodel import SQLModel, Session, create_engine
+from sqlalchemy import event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from pathlib import Path
 
 # 데이터베이스 파일 경로
@@ -8,27 +11,93 @@ DATABASE_PATH = Path(__file__).parent.parent / "data" / "maintenance_billing.db"
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
 # 엔진 생성 (SQLite 전용 설정)
+# Streamlit은 사용자 세션마다 별도 스레드에서 재실행되므로 단일 연결을 공유하는
+# StaticPool 대신 QueuePool로 연결을 재사용한다 (재실행마다 파일 open/close 방지)
 engine = create_engine(
     DATABASE_URL,
     echo=False,
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=False,
     connect_args={"check_same_thread": False}
 )
 
+# 세션 팩토리 (엔진 바인딩/옵션을 한 번만 구성)
+SessionLocal = sessionmaker(bind=engine, class_=Session)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """SQLite 성능 설정 (연결마다 적용)
+
+    - WAL: 쓰기 중에도 읽기 허용 (Streamlit 재실행 간 블로킹 방지)
+    - synchronous=NORMAL: WAL 모드에서 안전한 수준으로 fsync 감소
+    - temp_store/mmap_size/cache_size: 임시 테이블 메모리 사용, 페이지 읽기 시스템콜 감소
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64MB
+    cursor.close()
+
 
 def ensure_data_directory():
     """데이터 디렉토리 생성"""
     DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 
-def init_database():
-    """데이터베이스 초기화 (테이블 생성)"""
+# 프로세스 내 초기화 완료 여부 (create_all 메타데이터 조회 반복 방지)
+_initialized = False
+
+
+def init_database(force: bool = False):
+    """데이터베이스 초기화 (테이블 생성, 프로세스당 1회)"""
+    global _initialized
+    if _initialized and not force:
+        return
+
     ensure_data_directory()
     SQLModel.metadata.create_all(engine)
+    ensure_indexes()
+    ensure_integer_amounts()
+    _initialized = True
+
+
+def ensure_indexes():
+    """기존 DB에 누락된 인덱스 생성 (CREATE INDEX IF NOT EXISTS)
+
+    create_all은 이미 존재하는 테이블의 신규 인덱스를 생성하지 않으므로 별도 처리
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
+def ensure_integer_amounts():
+    """금액 컬럼의 실수(REAL) 저장값을 정수(원 단위)로 변환 (1회성 마이그레이션)
+
+    기존 Numeric 컬럼은 소수 금액을 REAL로 저장했으므로 WonAmount(INTEGER) 전환 후
+    남아있는 값을 반올림하여 정수로 맞춘다. 이미 정수인 행은 건드리지 않는다.
+    """
+    from database.models import WonAmount
+
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            for column in table.columns:
+                if isinstance(column.type, WonAmount):
+                    conn.execute(text(
+                        f"UPDATE {table.name} "
+                        f"SET {column.name} = CAST(ROUND({column.name}) AS INTEGER) "
+                        f"WHERE typeof({column.name}) = 'real'"
+                    ))
 
 
-def get_session():
-    """세션 생성"""
-    return Session(engine)
+def get_session() -> Session:
+    """세션 생성 (`with get_session() as session:` 형태로 사용, 종료 시 연결은 풀로 반환)"""
+    return SessionLocal()
 
 
 def get_engine():
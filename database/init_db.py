@@ -1,11 +1,73 @@
 """데이터베이스 초기화 스크립트 - 기본 데이터 포함"""
 
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
+from typing import Tuple
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import select
 from database.connection import init_database, get_session
 from database.models import CodeMapping, Company, Holiday
 
 
+# 기본 휴일 데이터 (2024-2026): (휴일, 명칭, 매년 반복 여부) - import 시 1회 생성
+DEFAULT_HOLIDAYS: Tuple[Tuple[date, str, bool], ...] = (
+    # 2024
+    (date(2024, 1, 1), "신정", True),
+    (date(2024, 2, 9), "설날 연휴", False),
+    (date(2024, 2, 10), "설날", False),
+    (date(2024, 2, 11), "설날 연휴", False),
+    (date(2024, 2, 12), "대체공휴일", False),
+    (date(2024, 3, 1), "삼일절", True),
+    (date(2024, 5, 5), "어린이날", True),
+    (date(2024, 5, 6), "대체공휴일", False),
+    (date(2024, 5, 15), "부처님오신날", False),
+    (date(2024, 6, 6), "현충일", True),
+    (date(2024, 8, 15), "광복절", True),
+    (date(2024, 9, 16), "추석 연휴", False),
+    (date(2024, 9, 17), "추석", False),
+    (date(2024, 9, 18), "추석 연휴", False),
+    (date(2024, 10, 3), "개천절", True),
+    (date(2024, 10, 9), "한글날", True),
+    (date(2024, 12, 25), "성탄절", True),
+    # 2025
+    (date(2025, 1, 1), "신정", True),
+    (date(2025, 1, 28), "설날 연휴", False),
+    (date(2025, 1, 29), "설날", False),
+    (date(2025, 1, 30), "설날 연휴", False),
+    (date(2025, 3, 1), "삼일절", True),
+    (date(2025, 5, 5), "어린이날/부처님오신날", False),
+    (date(2025, 5, 6), "대체공휴일", False),
+    (date(2025, 6, 6), "현충일", True),
+    (date(2025, 8, 15), "광복절", True),
+    (date(2025, 10, 3), "개천절", True),
+    (date(2025, 10, 5), "추석 연휴", False),
+    (date(2025, 10, 6), "추석", False),
+    (date(2025, 10, 7), "추석 연휴", False),
+    (date(2025, 10, 8), "대체공휴일", False),
+    (date(2025, 10, 9), "한글날", True),
+    (date(2025, 12, 25), "성탄절", True),
+    # 2026
+    (date(2026, 1, 1), "신정", True),
+    (date(2026, 2, 16), "설날 연휴", False),
+    (date(2026, 2, 17), "설날", False),
+    (date(2026, 2, 18), "설날 연휴", False),
+    (date(2026, 3, 1), "삼일절", True),
+    (date(2026, 3, 2), "대체공휴일(삼일절)", False),
+    (date(2026, 5, 5), "어린이날", True),
+    (date(2026, 5, 24), "부처님오신날", False),
+    (date(2026, 5, 25), "대체공휴일(부처님오신날)", False),
+    (date(2026, 6, 6), "현충일", True),
+    (date(2026, 8, 15), "광복절", True),
+    (date(2026, 8, 17), "대체공휴일(광복절)", False),
+    (date(2026, 9, 24), "추석 연휴", False),
+    (date(2026, 9, 25), "추석", False),
+    (date(2026, 9, 26), "추석 연휴", False),
+    (date(2026, 10, 3), "개천절", True),
+    (date(2026, 10, 9), "한글날", True),
+    (date(2026, 12, 25), "성탄절", True),
+)
+
+
 def create_default_code_mappings(session):
     """기본 창고/팀 코드 매핑 생성"""
     default_mappings = [
@@ -13,90 +75,30 @@ def create_default_code_mappings(session):
         {"code": "106", "name": "2팀", "category": "warehouse"},
     ]
 
-    for mapping in default_mappings:
-        existing = session.query(CodeMapping).filter(
-            CodeMapping.code == mapping["code"]
-        ).first()
-
-        if not existing:
-            session.add(CodeMapping(**mapping))
+    now = datetime.now()
+    statement = sqlite_insert(CodeMapping).values([
+        {**mapping, "is_active": True, "created_at": now, "updated_at": now}
+        for mapping in default_mappings
+    ]).on_conflict_do_nothing(index_elements=["code"])
+    session.execute(statement)
 
     session.commit()
 
 
 def create_default_holidays(session):
     """기본 휴일 데이터 생성 (2024-2026)"""
-    holidays_2024 = [
-        {"date": date(2024, 1, 1), "name": "신정", "is_recurring": True},
-        {"date": date(2024, 2, 9), "name": "설날 연휴", "is_recurring": False},
-        {"date": date(2024, 2, 10), "name": "설날", "is_recurring": False},
-        {"date": date(2024, 2, 11), "name": "설날 연휴", "is_recurring": False},
-        {"date": date(2024, 2, 12), "name": "대체공휴일", "is_recurring": False},
-        {"date": date(2024, 3, 1), "name": "삼일절", "is_recurring": True},
-        {"date": date(2024, 5, 5), "name": "어린이날", "is_recurring": True},
-        {"date": date(2024, 5, 6), "name": "대체공휴일", "is_recurring": False},
-        {"date": date(2024, 5, 15), "name": "부처님오신날", "is_recurring": False},
-        {"date": date(2024, 6, 6), "name": "현충일", "is_recurring": True},
-        {"date": date(2024, 8, 15), "name": "광복절", "is_recurring": True},
-        {"date": date(2024, 9, 16), "name": "추석 연휴", "is_recurring": False},
-        {"date": date(2024, 9, 17), "name": "추석", "is_recurring": False},
-        {"date": date(2024, 9, 18), "name": "추석 연휴", "is_recurring": False},
-        {"date": date(2024, 10, 3), "name": "개천절", "is_recurring": True},
-        {"date": date(2024, 10, 9), "name": "한글날", "is_recurring": True},
-        {"date": date(2024, 12, 25), "name": "성탄절", "is_recurring": True},
-    ]
-
-    holidays_2025 = [
-        {"date": date(2025, 1, 1), "name": "신정", "is_recurring": True},
-        {"date": date(2025, 1, 28), "name": "설날 연휴", "is_recurring": False},
-        {"date": date(2025, 1, 29), "name": "설날", "is_recurring": False},
-        {"date": date(2025, 1, 30), "name": "설날 연휴", "is_recurring": False},
-        {"date": date(2025, 3, 1), "name": "삼일절", "is_recurring": True},
-        {"date": date(2025, 5, 5), "name": "어린이날/부처님오신날", "is_recurring": False},
-        {"date": date(2025, 5, 6), "name": "대체공휴일", "is_recurring": False},
-        {"date": date(2025, 6, 6), "name": "현충일", "is_recurring": True},
-        {"date": date(2025, 8, 15), "name": "광복절", "is_recurring": True},
-        {"date": date(2025, 10, 3), "name": "개천절", "is_recurring": True},
-        {"date": date(2025, 10, 5), "name": "추석 연휴", "is_recurring": False},
-        {"date": date(2025, 10, 6), "name": "추석", "is_recurring": False},
-        {"date": date(2025, 10, 7), "name": "추석 연휴", "is_recurring": False},
-        {"date": date(2025, 10, 8), "name": "대체공휴일", "is_recurring": False},
-        {"date": date(2025, 10, 9), "name": "한글날", "is_recurring": True},
-        {"date": date(2025, 12, 25), "name": "성탄절", "is_recurring": True},
-    ]
-
-    holidays_2026 = [
-        {"date": date(2026, 1, 1), "name": "신정", "is_recurring": True},
-        {"date": date(2026, 2, 16), "name": "설날 연휴", "is_recurring": False},
-        {"date": date(2026, 2, 17), "name": "설날", "is_recurring": False},
-        {"date": date(2026, 2, 18), "name": "설날 연휴", "is_recurring": False},
-        {"date": date(2026, 3, 1), "name": "삼일절", "is_recurring": True},
-        {"date": date(2026, 3, 2), "name": "대체공휴일(삼일절)", "is_recurring": False},
-        {"date": date(2026, 5, 5), "name": "어린이날", "is_recurring": True},
-        {"date": date(2026, 5, 24), "name": "부처님오신날", "is_recurring": False},
-        {"date": date(2026, 5, 25), "name": "대체공휴일(부처님오신날)", "is_recurring": False},
-        {"date": date(2026, 6, 6), "name": "현충일", "is_recurring": True},
-        {"date": date(2026, 8, 15), "name": "광복절", "is_recurring": True},
-        {"date": date(2026, 8, 17), "name": "대체공휴일(광복절)", "is_recurring": False},
-        {"date": date(2026, 9, 24), "name": "추석 연휴", "is_recurring": False},
-        {"date": date(2026, 9, 25), "name": "추석", "is_recurring": False},
-        {"date": date(2026, 9, 26), "name": "추석 연휴", "is_recurring": False},
-        {"date": date(2026, 10, 3), "name": "개천절", "is_recurring": True},
-        {"date": date(2026, 10, 9), "name": "한글날", "is_recurring": True},
-        {"date": date(2026, 12, 25), "name": "성탄절", "is_recurring": True},
-    ]
-
-    for holiday in holidays_2024 + holidays_2025 + holidays_2026:
-        existing = session.query(Holiday).filter(
-            Holiday.holiday_date == holiday["date"]
-        ).first()
-
-        if not existing:
-            session.add(Holiday(
-                holiday_date=holiday["date"],
-                name=holiday["name"],
-                is_recurring=holiday.get("is_recurring", False)
-            ))
+    # 단일 INSERT OR IGNORE (holiday_date unique 인덱스로 중복 무시)
+    now = datetime.now()
+    statement = sqlite_insert(Holiday).values([
+        {
+            "holiday_date": holiday_date,
+            "name": name,
+            "is_recurring": is_recurring,
+            "created_at": now,
+        }
+        for holiday_date, name, is_recurring in DEFAULT_HOLIDAYS
+    ]).on_conflict_do_nothing(index_elements=["holiday_date"])
+    session.execute(statement)
 
     session.commit()
 
@@ -115,13 +117,19 @@ def create_sample_data(session):
         {"code": "V002", "name": "외주업체B", "company_type": "purchase"},
     ]
 
-    for company_data in sales_companies + purchase_companies:
-        existing = session.query(Company).filter(
-            Company.code == company_data["code"]
-        ).first()
-
-        if not existing:
-            session.add(Company(**company_data))
+    # 업체 코드는 unique 제약이 없으므로 기존 코드를 한 번에 조회 후 누락분만 추가
+    all_companies = sales_companies + purchase_companies
+    existing_codes = set(session.exec(
+        select(Company.code).where(
+            Company.code.in_([c["code"] for c in all_companies])
+        )
+    ).all())
+
+    session.add_all([
+        Company(**company_data)
+        for company_data in all_companies
+        if company_data["code"] not in existing_codes
+    ])
 
     session.commit()
 
@@ -1,13 +1,36 @@
 """SQLModel 데이터 모델 정의 - 사내 표준 스키마"""
 
 from datetime import date, datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional, List
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, Text, JSON
+from sqlalchemy import Column, Text, JSON, Index, BigInteger
+from sqlalchemy.types import TypeDecorator
 import json
 
 
+class WonAmount(TypeDecorator):
+    """원 단위 금액 타입 - DB에는 INTEGER, Python에서는 Decimal
+
+    원화는 소수 단위가 없으므로 정수로 저장한다. Numeric(float 저장 + 문자열 경유
+    Decimal 변환) 대비 조회 비용이 적고, 계산 코드는 기존대로 Decimal을 사용한다.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return value
+        return int(Decimal(value).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(value)
+
+
 class CodeMapping(SQLModel, table=True):
     """창고/팀 코드 매핑 (확장 가능)"""
     __tablename__ = "code_mappings"
@@ -54,7 +77,7 @@ class Contract(SQLModel, table=True):
     contract_end: Optional[date] = None
 
     # 금액
-    monthly_amount: Decimal = Field(default=Decimal("0"))  # 월 계약금액
+    monthly_amount: Decimal = Field(default=Decimal("0"), sa_type=WonAmount)  # 월 계약금액
 
     # 청구 설정
     billing_cycle: str = Field(default="monthly")  # monthly, quarterly, semiannual, biannual, irregular
@@ -70,11 +93,11 @@ class Contract(SQLModel, table=True):
 
     # 외주 기본값
     default_outsourcing_company_id: Optional[int] = Field(default=None, foreign_key="companies.id")
-    default_outsourcing_amount: Decimal = Field(default=Decimal("0"))  # 월 기준 외주금액
+    default_outsourcing_amount: Decimal = Field(default=Decimal("0"), sa_type=WonAmount)  # 월 기준 외주금액
     outsourcing_amount_zero: bool = Field(default=False)  # 외주금액 0 명시 설정
 
     # 상태
-    status: str = Field(default="active")  # active, expired, terminated, period_undefined
+    status: str = Field(default="active", index=True)  # active, expired, terminated, period_undefined
 
     # 특이사항
     notes: Optional[str] = Field(default=None, sa_column=Column(Text))
@@ -97,6 +120,10 @@ class Contract(SQLModel, table=True):
 class ContractHistory(SQLModel, table=True):
     """계약 변경 이력 (금액/기간 변경 추적)"""
     __tablename__ = "contract_history"
+    __table_args__ = (
+        # 계약별 유효 금액 이력 조회 (contract_id + change_type 일치, effective_date 범위/정렬)
+        Index("ix_ch_contract_type_effective", "contract_id", "change_type", "effective_date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     contract_id: int = Field(foreign_key="contracts.id")
@@ -122,6 +149,12 @@ class ContractHistory(SQLModel, table=True):
 class MonthlyBilling(SQLModel, table=True):
     """월별 청구 레코드"""
     __tablename__ = "monthly_billings"
+    __table_args__ = (
+        # 월별 조회/상태 집계 (사이드바, 대시보드, 청구 목록)
+        Index("ix_mb_year_month_status", "billing_year", "billing_month", "status"),
+        # 계약별 월 청구 존재 확인 (누락/중복/전월 조회)
+        Index("ix_mb_contract_year_month", "contract_id", "billing_year", "billing_month"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     contract_id: int = Field(foreign_key="contracts.id")
@@ -132,17 +165,17 @@ class MonthlyBilling(SQLModel, table=True):
     cover_months: int = Field(default=1)  # 커버 개월 수 (분기=3, 반기=6 등)
 
     # 금액 (자동계산 + 오버라이드)
-    calculated_amount: Decimal = Field(default=Decimal("0"))  # 시스템 계산값
-    override_amount: Optional[Decimal] = None  # 사용자 오버라이드
-    final_amount: Decimal = Field(default=Decimal("0"))  # 최종 청구금액
+    calculated_amount: Decimal = Field(default=Decimal("0"), sa_type=WonAmount)  # 시스템 계산값
+    override_amount: Optional[Decimal] = Field(default=None, sa_type=WonAmount)  # 사용자 오버라이드
+    final_amount: Decimal = Field(default=Decimal("0"), sa_type=WonAmount)  # 최종 청구금액
 
     # 부가세/합계
-    vat_amount: Decimal = Field(default=Decimal("0"))
-    total_amount: Decimal = Field(default=Decimal("0"))
+    vat_amount: Decimal = Field(default=Decimal("0"), sa_type=WonAmount)
+    total_amount: Decimal = Field(default=Decimal("0"), sa_type=WonAmount)
 
     # 외주/이익
-    outsourcing_amount: Decimal = Field(default=Decimal("0"))  # 외주금액 합계
-    profit: Decimal = Field(default=Decimal("0"))  # 실제이익
+    outsourcing_amount: Decimal = Field(default=Decimal("0"), sa_type=WonAmount)  # 외주금액 합계
+    profit: Decimal = Field(default=Decimal("0"), sa_type=WonAmount)  # 실제이익
 
     # 발행일자
     sales_date: Optional[date] = None  # 매출일자 (계산서작성일)
@@ -177,7 +210,7 @@ class Outsourcing(SQLModel, table=True):
     outsourcing_company_id: int = Field(foreign_key="companies.id")
 
     # 기본 외주금액 (월 기준)
-    monthly_amount: Decimal = Field(default=Decimal("0"))
+    monthly_amount: Decimal = Field(default=Decimal("0"), sa_type=WonAmount)
 
     # 적용 기간
     effective_from: Optional[date] = None
@@ -197,11 +230,11 @@ class OutsourcingEntry(SQLModel, table=True):
     __tablename__ = "outsourcing_entries"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    billing_id: int = Field(foreign_key="monthly_billings.id")
+    billing_id: int = Field(foreign_key="monthly_billings.id", index=True)
     outsourcing_company_id: int = Field(foreign_key="companies.id")
 
     # 매입 정보
-    amount: Decimal
+    amount: Decimal = Field(sa_type=WonAmount)
     purchase_date: Optional[date] = None
 
     notes: Optional[str] = None
@@ -220,8 +253,8 @@ class OutsourcingHistory(SQLModel, table=True):
     outsourcing_id: int = Field(foreign_key="outsourcings.id")
 
     effective_date: date
-    old_amount: Decimal
-    new_amount: Decimal
+    old_amount: Decimal = Field(sa_type=WonAmount)
+    new_amount: Decimal = Field(sa_type=WonAmount)
     reason: Optional[str] = None
 
     created_at: datetime = Field(default_factory=datetime.now)
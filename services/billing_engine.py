@@ -2,29 +2,35 @@
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
 import json
-from sqlmodel import Session, select
+from sqlmodel import Session, select, and_, or_
+from sqlalchemy import insert, update
+from sqlalchemy.orm import defer, selectinload
 
 from database.models import (
     Contract, ContractHistory, MonthlyBilling, Company, Holiday
 )
 from utils.constants import (
-    BillingCycle, BillingStatus, ContractStatus,
-    BILLING_CYCLE_MONTHS, BILLING_CYCLE_TARGET_MONTHS,
-    DEFAULT_RENEWAL_PERIOD_MONTHS
+    BillingStatus, BILLABLE_CONTRACT_STATUSES,
+    BILLING_CYCLE_MONTHS, BILLING_CYCLE_TARGET_MONTHS
 )
 from utils.date_utils import (
-    calculate_contract_period_status,
     is_billing_target_month,
     parse_billing_timing,
     calculate_billing_date,
     get_last_day_of_month
 )
+from utils.json_utils import dumps_json
 from services.calculation_engine import CalculationEngine
 from services.validation_engine import ValidationEngine
 
 
+def _no_suggested_date(billing_year: int, billing_month: int, holidays: FrozenSet[date]) -> None:
+    """발행일자 제안 없음 (역발행/수동 확인 필요)"""
+    return None
+
+
 class BillingEngine:
     """청구 생성 엔진 - 사내 표준 순서 적용"""
 
@@ -33,6 +39,13 @@ class BillingEngine:
         self.calc_engine = CalculationEngine(session)
         self.validation_engine = ValidationEngine(session)
 
+        # 커스텀 청구월 캐시 (파싱 JSON 문자열 기준, 동일 문자열 반복 파싱 방지)
+        self._custom_months_cache: Dict[str, Optional[List[int]]] = {}
+
+        # 연도별 휴일 / 계약별 발행일자 제안 함수 캐시
+        self._holidays_cache: Dict[int, FrozenSet[date]] = {}
+        self._date_fn_cache: Dict[tuple, Callable[[int, int, FrozenSet[date]], Optional[date]]] = {}
+
     def generate_monthly_billings(
         self,
         billing_year: int,
@@ -59,13 +72,12 @@ class BillingEngine:
         billings = []
         all_warnings = []
 
-        # 1) 이미 생성된 청구 제외
-        existing_statement = select(MonthlyBilling).where(
+        # 1) 이미 생성된 청구 제외 (계약 ID만 조회)
+        existing_statement = select(MonthlyBilling.contract_id).where(
             MonthlyBilling.billing_year == billing_year,
             MonthlyBilling.billing_month == billing_month
         )
-        existing_billings = self.session.exec(existing_statement).all()
-        existing_contract_ids = {b.contract_id for b in existing_billings}
+        existing_contract_ids = set(self.session.exec(existing_statement).all())
 
         # 2) 대상 계약 산출
         target_contracts = self._get_target_contracts(
@@ -73,19 +85,35 @@ class BillingEngine:
             exclude_contract_ids or []
         )
 
+        # 계약변경 이력 사전 조회 (계약별 개별 조회 방지)
+        self.calc_engine.prefetch_effective_amounts(
+            [c.id for c in target_contracts], check_date
+        )
+
         # 휴일 조회
         holidays = self._get_holidays(billing_year)
 
+        # 청구대상월 여부는 (청구주기, 커스텀 청구월)에만 의존하므로 조합별 1회만 판정
+        target_month_cache: Dict[Tuple[str, Tuple[int, ...]], bool] = {}
+        pairs: List[Tuple[MonthlyBilling, Contract]] = []
+
         for contract in target_contracts:
             # 이미 생성된 계약 스킵
             if contract.id in existing_contract_ids:
                 continue
 
             # 3) 청구주기 검증
-            billing_cycle = BillingCycle(contract.billing_cycle)
             custom_months = self._get_custom_billing_months(contract)
+            cycle_key = (contract.billing_cycle, tuple(custom_months or ()))
+
+            is_target = target_month_cache.get(cycle_key)
+            if is_target is None:
+                is_target = is_billing_target_month(
+                    contract.billing_cycle, billing_year, billing_month, custom_months
+                )
+                target_month_cache[cycle_key] = is_target
 
-            if not is_billing_target_month(billing_cycle, billing_year, billing_month, custom_months):
+            if not is_target:
                 continue
 
             # 청구 레코드 생성
@@ -96,17 +124,21 @@ class BillingEngine:
                 holidays
             )
 
-            # 9) 검증 로직 수행
-            warnings = self.validation_engine.validate_billing(billing, contract)
+            pairs.append((billing, contract))
+
+        # 9) 검증 로직 수행 (전월/동월 청구 일괄 조회)
+        results = self.validation_engine.validate_billings_bulk(pairs)
+        for (billing, contract), warnings in zip(pairs, results):
             if warnings:
-                billing.warnings = json.dumps(warnings, ensure_ascii=False)
+                warning_dicts = [w.to_dict() for w in warnings]
+                billing.warnings = dumps_json(warning_dicts)
                 billing.has_warnings = True
                 all_warnings.extend([{
                     'billing_id': None,  # 아직 저장 전
                     'contract_id': contract.id,
                     'company_name': contract.company.name if contract.company else '',
                     **w
-                } for w in warnings])
+                } for w in warning_dicts])
 
             billings.append(billing)
 
@@ -117,51 +149,59 @@ class BillingEngine:
         check_date: date,
         exclude_ids: List[int]
     ) -> List[Contract]:
-        """대상 계약 산출 (자동갱신 포함)"""
-        statement = select(Contract).where(
-            Contract.status.in_([
-                ContractStatus.ACTIVE.value,
-                ContractStatus.PERIOD_UNDEFINED.value
-            ])
-        )
+        """대상 계약 산출 (자동갱신 포함)
 
-        if exclude_ids:
-            statement = statement.where(Contract.id.notin_(exclude_ids))
+        calculate_contract_period_status의 유효 판정을 SQL 조건으로 옮긴 것:
+        - 계약시작일/종료일 미확정 → 유효
+        - 계약기간 내 → 유효
+        - 만료 후 자동갱신 → 롤링 계산 결과와 무관하게 항상 유효
+        - 만료(자동갱신 없음) / 계약 시작 전 → 제외
 
-        all_contracts = self.session.exec(statement).all()
-        target_contracts = []
-
-        for contract in all_contracts:
-            # 계약기간 상태 확인 (자동갱신 롤링 계산)
-            is_active, _, _, _ = calculate_contract_period_status(
-                contract.contract_start,
-                contract.contract_end,
-                contract.auto_renewal,
-                contract.renewal_period_months or DEFAULT_RENEWAL_PERIOD_MONTHS,
-                check_date
+        경고의 업체명 표시용 업체는 계약별 지연 로드 대신 일괄 로드한다.
+        """
+        statement = select(Contract).where(
+            Contract.status.in_(BILLABLE_CONTRACT_STATUSES),
+            or_(
+                Contract.contract_start.is_(None),
+                Contract.contract_end.is_(None),
+                and_(
+                    Contract.contract_start <= check_date,
+                    Contract.contract_end >= check_date
+                ),
+                and_(
+                    Contract.contract_end < check_date,
+                    Contract.auto_renewal == True  # noqa: E712
+                )
             )
+        ).options(selectinload(Contract.company))
 
-            if is_active:
-                target_contracts.append(contract)
+        if exclude_ids:
+            statement = statement.where(Contract.id.notin_(exclude_ids))
 
-        return target_contracts
+        return self.session.exec(statement).all()
 
     def _get_custom_billing_months(self, contract: Contract) -> Optional[List[int]]:
         """비정기 청구의 경우 커스텀 청구월 조회"""
-        if contract.billing_timing_parsed:
+        raw = contract.billing_timing_parsed
+        if not raw:
+            return None
+
+        if raw not in self._custom_months_cache:
+            months = None
             try:
-                parsed = json.loads(contract.billing_timing_parsed)
-                return parsed.get('months')
+                months = json.loads(raw).get('months')
             except json.JSONDecodeError:
                 pass
-        return None
+            self._custom_months_cache[raw] = months
+
+        return self._custom_months_cache[raw]
 
     def _create_billing_record(
         self,
         contract: Contract,
         billing_year: int,
         billing_month: int,
-        holidays: List[date]
+        holidays: FrozenSet[date]
     ) -> MonthlyBilling:
         """청구 레코드 생성"""
         # 4) 계약변경 이력 적용 + 5) 청구금액 산정
@@ -208,52 +248,85 @@ class BillingEngine:
         contract: Contract,
         billing_year: int,
         billing_month: int,
-        holidays: List[date]
+        holidays: FrozenSet[date]
     ) -> Optional[date]:
-        """발행일자 자동 제안"""
+        """발행일자 자동 제안 (계약별 제안 함수 캐시)"""
+        key = (contract.id, contract.is_reverse_billing, contract.billing_timing)
+        date_fn = self._date_fn_cache.get(key)
+        if date_fn is None:
+            date_fn = self._build_date_fn(contract)
+            self._date_fn_cache[key] = date_fn
+
+        return date_fn(billing_year, billing_month, holidays)
+
+    def _build_date_fn(
+        self,
+        contract: Contract
+    ) -> Callable[[int, int, FrozenSet[date]], Optional[date]]:
+        """계약별 발행일자 제안 함수 생성 (발행시기 분기 판단을 1회로 고정)"""
         # 역발행인 경우 제안 없음
         if contract.is_reverse_billing:
-            return None
+            return _no_suggested_date
+
+        # 기본값: 말일
+        day = 'last'
 
         # 발행시기 파싱
         if contract.billing_timing:
             parsed = parse_billing_timing(contract.billing_timing)
 
-            if parsed['is_reverse_billing']:
-                return None
+            if parsed.is_reverse_billing or parsed.requires_manual:
+                return _no_suggested_date
 
-            if parsed['requires_manual']:
-                return None
+            if parsed.day:
+                day = parsed.day
 
-            if parsed['day']:
-                return calculate_billing_date(
-                    billing_year, billing_month, parsed['day'], holidays
-                )
-
-        # 기본값: 말일
-        return calculate_billing_date(
-            billing_year, billing_month, 'last', holidays
+        return lambda year, month, holidays: calculate_billing_date(
+            year, month, day, holidays
         )
 
-    def _get_holidays(self, year: int) -> List[date]:
-        """해당 연도 휴일 조회"""
-        statement = select(Holiday).where(
-            Holiday.holiday_date >= date(year, 1, 1),
-            Holiday.holiday_date <= date(year, 12, 31)
-        )
-        holidays = self.session.exec(statement).all()
-        return [h.holiday_date for h in holidays]
+    def _get_holidays(self, year: int) -> FrozenSet[date]:
+        """해당 연도 휴일 조회 (엔진 내 연도별 캐시, 휴일 판정은 set 조회)"""
+        holidays = self._holidays_cache.get(year)
+        if holidays is None:
+            statement = select(Holiday.holiday_date).where(
+                Holiday.holiday_date >= date(year, 1, 1),
+                Holiday.holiday_date <= date(year, 12, 31)
+            )
+            holidays = frozenset(self.session.exec(statement).all())
+            self._holidays_cache[year] = holidays
+        return holidays
 
     def save_billings(self, billings: List[MonthlyBilling]) -> List[MonthlyBilling]:
-        """청구 저장"""
-        for billing in billings:
-            self.session.add(billing)
+        """청구 저장 (Core 일괄 INSERT + 단일 커밋)
+
+        ORM 건별 flush 대신 단일 INSERT ... RETURNING 으로 저장하고,
+        발급된 id를 입력 객체에 반영한 뒤 세션에 적재된 객체 목록을 반환한다.
+        """
+        if not billings:
+            return billings
+
+        rows = [billing.model_dump(exclude={'id'}) for billing in billings]
+        billing_ids = self.session.scalars(
+            insert(MonthlyBilling).returning(
+                MonthlyBilling.id, sort_by_parameter_order=True
+            ),
+            rows
+        ).all()
         self.session.commit()
 
-        for billing in billings:
-            self.session.refresh(billing)
+        for billing, billing_id in zip(billings, billing_ids):
+            billing.id = billing_id
 
-        return billings
+        # 저장된 청구를 단일 SELECT로 적재 (입력 순서 유지)
+        saved = {
+            billing.id: billing
+            for billing in self.session.exec(
+                select(MonthlyBilling).where(MonthlyBilling.id.in_(billing_ids))
+            ).all()
+        }
+
+        return [saved[billing_id] for billing_id in billing_ids]
 
     def confirm_billing(self, billing_id: int) -> MonthlyBilling:
         """청구 확정"""
@@ -284,37 +357,57 @@ class BillingEngine:
         request_date: Optional[date] = None,
         notes: Optional[str] = None
     ) -> MonthlyBilling:
-        """청구 수동 오버라이드"""
-        billing = self.session.get(MonthlyBilling, billing_id)
-        if not billing:
+        """청구 수동 오버라이드
+
+        상태/외주금액만 조회한 뒤 재계산 값을 단일 UPDATE ... RETURNING 으로 반영한다.
+        """
+        row = self.session.exec(
+            select(MonthlyBilling.status, MonthlyBilling.outsourcing_amount).where(
+                MonthlyBilling.id == billing_id
+            )
+        ).first()
+        if row is None:
             raise ValueError(f"Billing {billing_id} not found")
 
-        if billing.status == BillingStatus.LOCKED.value:
+        status, outsourcing_amount = row
+        if status == BillingStatus.LOCKED.value:
             raise ValueError("Cannot modify locked billing")
 
+        values = {'updated_at': datetime.now()}
+
         if override_amount is not None:
-            billing.override_amount = override_amount
-            billing.final_amount = override_amount
             # 부가세/합계/이익 재계산
             vat, total = self.calc_engine.calculate_vat_and_total(override_amount)
-            billing.vat_amount = vat
-            billing.total_amount = total
-            billing.profit = self.calc_engine.calculate_profit(
-                override_amount, billing.outsourcing_amount
+            values.update(
+                override_amount=override_amount,
+                final_amount=override_amount,
+                vat_amount=vat,
+                total_amount=total,
+                profit=self.calc_engine.calculate_profit(override_amount, outsourcing_amount)
             )
 
         if sales_date is not None:
-            billing.sales_date = sales_date
+            values['sales_date'] = sales_date
 
         if request_date is not None:
-            billing.request_date = request_date
+            values['request_date'] = request_date
 
         if notes is not None:
-            billing.notes = notes
+            values['notes'] = notes
+
+        # 조회 이후 잠긴 경우에도 수정되지 않도록 잠금 상태 조건 포함
+        billing = self.session.scalars(
+            update(MonthlyBilling).where(
+                MonthlyBilling.id == billing_id,
+                MonthlyBilling.status != BillingStatus.LOCKED.value
+            ).values(**values).returning(MonthlyBilling),
+            execution_options={'populate_existing': True}
+        ).first()
+        if billing is None:
+            self.session.rollback()
+            raise ValueError("Cannot modify locked billing")
 
-        billing.updated_at = datetime.now()
         self.session.commit()
-        self.session.refresh(billing)
 
         return billing
 
@@ -324,11 +417,11 @@ class BillingEngine:
         month: int,
         status: Optional[str] = None
     ) -> List[MonthlyBilling]:
-        """월별 청구 조회"""
+        """월별 청구 조회 (경고 JSON/메모는 접근 시 지연 로드)"""
         statement = select(MonthlyBilling).where(
             MonthlyBilling.billing_year == year,
             MonthlyBilling.billing_month == month
-        )
+        ).options(defer(MonthlyBilling.warnings), defer(MonthlyBilling.notes))
 
         if status:
             statement = statement.where(MonthlyBilling.status == status)
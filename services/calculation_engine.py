@@ -1,25 +1,90 @@
 """계산 엔진 - 청구금액, 외주금액, 실제이익 계산"""
 
+import json
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
-from typing import List, Optional, Tuple
-from sqlmodel import Session, select
+from typing import Dict, List, Optional, Tuple
+from sqlmodel import Session, select, func
+from sqlalchemy import BigInteger
 
 from database.models import (
-    Contract, ContractHistory, MonthlyBilling,
+    Company, Contract, ContractHistory, MonthlyBilling,
     Outsourcing, OutsourcingEntry
 )
-from utils.constants import BillingCycle, BILLING_CYCLE_MONTHS
+from utils.constants import BILLING_CYCLE_MONTHS_BY_VALUE
 
 
 class CalculationEngine:
     """계산 엔진 - 사내 표준 계산 규칙 적용"""
 
     VAT_RATE = Decimal("0.1")  # 부가세율 10%
+    _WON_UNIT = Decimal("1")  # 원 단위 반올림 기준
 
     def __init__(self, session: Session):
         self.session = session
 
+        # 이력 반영 유효금액 사전 조회 캐시 (contract_id → Decimal 또는 None=기본값 사용)
+        self._prefetch_date: Optional[date] = None
+        self._amount_cache: Dict[int, Optional[Decimal]] = {}
+        self._outsourcing_cache: Dict[int, Optional[Decimal]] = {}
+
+    def prefetch_effective_amounts(
+        self,
+        contract_ids: List[int],
+        check_date: date
+    ) -> None:
+        """계약별 유효 계약금액/외주금액 이력을 단일 쿼리로 사전 조회
+
+        계약·변경유형별 적용일 기준 최신 이력 1건만 조회하여 캐시한다.
+        이후 같은 기준일의 `_get_effective_amount` / `_get_effective_outsourcing_amount`
+        호출은 쿼리 없이 캐시를 사용한다.
+        """
+        ranked = select(
+            ContractHistory.contract_id,
+            ContractHistory.change_type,
+            ContractHistory.new_value,
+            func.row_number().over(
+                partition_by=(ContractHistory.contract_id, ContractHistory.change_type),
+                order_by=(ContractHistory.effective_date.desc(), ContractHistory.id.desc())
+            ).label('rn')
+        ).where(
+            ContractHistory.contract_id.in_(contract_ids),
+            ContractHistory.change_type.in_(('amount', 'outsourcing')),
+            ContractHistory.effective_date <= check_date
+        ).subquery()
+
+        rows = self.session.exec(
+            select(ranked.c.contract_id, ranked.c.change_type, ranked.c.new_value)
+            .where(ranked.c.rn == 1)
+        ).all()
+
+        # 이력 없는 계약은 None (기본값 사용)
+        self._amount_cache = dict.fromkeys(contract_ids)
+        self._outsourcing_cache = dict.fromkeys(contract_ids)
+
+        for contract_id, change_type, new_value in rows:
+            if change_type == 'amount':
+                self._amount_cache[contract_id] = self._parse_history_value(
+                    new_value, 'monthly_amount'
+                )
+            else:
+                self._outsourcing_cache[contract_id] = self._parse_history_value(
+                    new_value, 'outsourcing_amount'
+                )
+
+        self._prefetch_date = check_date
+
+    @staticmethod
+    def _parse_history_value(new_value: Optional[str], key: str) -> Optional[Decimal]:
+        """변경 이력 new_value JSON에서 금액 추출 (없으면 None)"""
+        if not new_value:
+            return None
+
+        parsed = json.loads(new_value)
+        if key in parsed:
+            return Decimal(str(parsed[key]))
+        return None
+
     def calculate_billing_amount(
         self,
         contract: Contract,
@@ -40,8 +105,7 @@ class CalculationEngine:
         """
         # 커버 개월 수 결정
         if cover_months is None:
-            billing_cycle = BillingCycle(contract.billing_cycle)
-            cover_months = BILLING_CYCLE_MONTHS.get(billing_cycle, 1)
+            cover_months = BILLING_CYCLE_MONTHS_BY_VALUE.get(contract.billing_cycle, 1)
 
         # 적용 월 기준 계약금액 조회 (이력 반영)
         effective_amount = self._get_effective_amount(
@@ -68,6 +132,11 @@ class CalculationEngine:
         """적용 월 기준 유효 계약금액 조회 (이력 반영)"""
         check_date = date(year, month, 1)
 
+        # 사전 조회 캐시 사용
+        if check_date == self._prefetch_date and contract_id in self._amount_cache:
+            cached = self._amount_cache[contract_id]
+            return cached if cached is not None else default_amount
+
         # 금액 변경 이력 조회 (적용일 기준 내림차순)
         statement = select(ContractHistory).where(
             ContractHistory.contract_id == contract_id,
@@ -77,11 +146,10 @@ class CalculationEngine:
 
         history = self.session.exec(statement).first()
 
-        if history and history.new_value:
-            import json
-            new_value = json.loads(history.new_value)
-            if 'monthly_amount' in new_value:
-                return Decimal(str(new_value['monthly_amount']))
+        if history:
+            amount = self._parse_history_value(history.new_value, 'monthly_amount')
+            if amount is not None:
+                return amount
 
         return default_amount
 
@@ -94,9 +162,15 @@ class CalculationEngine:
         Returns:
             (vat_amount, total_amount)
         """
-        vat = (billing_amount * self.VAT_RATE).quantize(
-            Decimal('1'), rounding=ROUND_HALF_UP
-        )
+        if isinstance(billing_amount, int) or billing_amount == billing_amount.to_integral_value():
+            # 원 단위 정수 금액: 정수 연산으로 10% 반올림 (ROUND_HALF_UP, 0에서 먼 쪽)
+            amount = int(billing_amount)
+            vat_won = (abs(amount) + 5) // 10
+            vat = Decimal(vat_won if amount >= 0 else -vat_won)
+        else:
+            vat = (billing_amount * self.VAT_RATE).quantize(
+                self._WON_UNIT, rounding=ROUND_HALF_UP
+            )
         total = billing_amount + vat
         return (vat, total)
 
@@ -122,17 +196,19 @@ class CalculationEngine:
         if contract.outsourcing_amount_zero:
             return (Decimal("0"), "외주금액 0 설정")
 
-        # 매입건 조회 (billing_id가 있는 경우)
+        # 매입건 합계/건수 조회 (billing_id가 있는 경우, SQL 집계)
         if billing_id:
-            statement = select(OutsourcingEntry).where(
+            statement = select(
+                self._sum_won(OutsourcingEntry.amount),
+                func.count()
+            ).where(
                 OutsourcingEntry.billing_id == billing_id
             )
-            entries = self.session.exec(statement).all()
+            total, entry_count = self.session.exec(statement).one()
 
-            if entries:
-                total = sum(entry.amount for entry in entries)
-                note = f"매입건 {len(entries)}건 합산"
-                return (total, note)
+            if entry_count:
+                note = f"매입건 {entry_count}건 합산"
+                return (Decimal(total), note)
 
         # 매입건 없음 → 기본값 적용
         if contract.default_outsourcing_amount > 0:
@@ -159,6 +235,11 @@ class CalculationEngine:
         """적용 월 기준 유효 외주금액 조회 (이력 반영)"""
         check_date = date(year, month, 1)
 
+        # 사전 조회 캐시 사용
+        if check_date == self._prefetch_date and contract_id in self._outsourcing_cache:
+            cached = self._outsourcing_cache[contract_id]
+            return cached if cached is not None else default_amount
+
         # 외주금액 변경 이력 조회
         statement = select(ContractHistory).where(
             ContractHistory.contract_id == contract_id,
@@ -168,11 +249,10 @@ class CalculationEngine:
 
         history = self.session.exec(statement).first()
 
-        if history and history.new_value:
-            import json
-            new_value = json.loads(history.new_value)
-            if 'outsourcing_amount' in new_value:
-                return Decimal(str(new_value['outsourcing_amount']))
+        if history:
+            amount = self._parse_history_value(history.new_value, 'outsourcing_amount')
+            if amount is not None:
+                return amount
 
         return default_amount
 
@@ -195,6 +275,8 @@ class CalculationEngine:
     ) -> dict:
         """월별 집계 계산
 
+        금액은 원 단위 정수(int)로 누적한 뒤 반환 직전에 Decimal로 변환한다.
+
         Returns:
             {
                 'total_billing': Decimal,
@@ -204,60 +286,22 @@ class CalculationEngine:
                 'by_warehouse': dict  # 창고별 집계
             }
         """
-        statement = select(MonthlyBilling).where(
-            MonthlyBilling.billing_year == year,
-            MonthlyBilling.billing_month == month,
-            MonthlyBilling.status != 'cancelled'
-        )
+        result = self._empty_monthly_summary()
 
-        billings = self.session.exec(statement).all()
-
-        result = {
-            'total_billing': Decimal("0"),
-            'total_outsourcing': Decimal("0"),
-            'total_profit': Decimal("0"),
-            'count': 0,
-            'by_warehouse': {}
-        }
+        statement = self._summary_statement(year, warehouse_code, month)
+        for _, wh, billing, outsourcing, profit, count in self.session.exec(statement):
+            self._add_summary_row(result, wh, billing, outsourcing, profit, count)
 
-        for billing in billings:
-            contract = billing.contract
-            if contract is None:
-                continue
-
-            # 창고 필터
-            company_warehouse = contract.company.warehouse_code if contract.company else None
-            if warehouse_code and company_warehouse != warehouse_code:
-                continue
-
-            result['total_billing'] += billing.final_amount
-            result['total_outsourcing'] += billing.outsourcing_amount
-            result['total_profit'] += billing.profit
-            result['count'] += 1
-
-            # 창고별 집계
-            wh = company_warehouse or 'unknown'
-            if wh not in result['by_warehouse']:
-                result['by_warehouse'][wh] = {
-                    'billing': Decimal("0"),
-                    'outsourcing': Decimal("0"),
-                    'profit': Decimal("0"),
-                    'count': 0
-                }
-
-            result['by_warehouse'][wh]['billing'] += billing.final_amount
-            result['by_warehouse'][wh]['outsourcing'] += billing.outsourcing_amount
-            result['by_warehouse'][wh]['profit'] += billing.profit
-            result['by_warehouse'][wh]['count'] += 1
-
-        return result
+        return self._to_decimal_summary(result)
 
     def calculate_yearly_summary(
         self,
         year: int,
         warehouse_code: Optional[str] = None
     ) -> dict:
-        """연도별 집계 계산
+        """연도별 집계 계산 (월·창고별 GROUP BY 단일 쿼리)
+
+        금액은 원 단위 정수(int)로 누적한 뒤 반환 직전에 Decimal로 변환한다.
 
         Returns:
             {
@@ -269,19 +313,112 @@ class CalculationEngine:
             }
         """
         result = {
-            'total_billing': Decimal("0"),
-            'total_outsourcing': Decimal("0"),
-            'total_profit': Decimal("0"),
+            'total_billing': 0,
+            'total_outsourcing': 0,
+            'total_profit': 0,
             'count': 0,
-            'by_month': {}
+            'by_month': {
+                month: self._empty_monthly_summary() for month in range(1, 13)
+            }
         }
 
-        for month in range(1, 13):
-            monthly = self.calculate_monthly_summary(year, month, warehouse_code)
-            result['total_billing'] += monthly['total_billing']
-            result['total_outsourcing'] += monthly['total_outsourcing']
-            result['total_profit'] += monthly['total_profit']
-            result['count'] += monthly['count']
-            result['by_month'][month] = monthly
+        statement = self._summary_statement(year, warehouse_code)
+        # 월별 피벗과 연간 합계를 단일 루프에서 함께 누적
+        by_month = result['by_month']
+        for month, wh, billing, outsourcing, profit, count in self.session.exec(statement):
+            self._add_summary_row(by_month[month], wh, billing, outsourcing, profit, count)
+            result['total_billing'] += billing
+            result['total_outsourcing'] += outsourcing
+            result['total_profit'] += profit
+            result['count'] += count
+
+        for month_summary in by_month.values():
+            self._to_decimal_summary(month_summary)
+        return self._to_decimal_summary(result)
+
+    def _summary_statement(
+        self,
+        year: int,
+        warehouse_code: Optional[str] = None,
+        month: Optional[int] = None
+    ):
+        """월·창고별 합계 쿼리 (취소 청구 제외)
+
+        Rows: (billing_month, warehouse_code, billing, outsourcing, profit, count)
+        """
+        statement = select(
+            MonthlyBilling.billing_month,
+            Company.warehouse_code,
+            self._sum_won(MonthlyBilling.final_amount),
+            self._sum_won(MonthlyBilling.outsourcing_amount),
+            self._sum_won(MonthlyBilling.profit),
+            func.count()
+        ).select_from(MonthlyBilling).join(
+            Contract, MonthlyBilling.contract_id == Contract.id
+        ).outerjoin(
+            Company, Contract.company_id == Company.id
+        ).where(
+            MonthlyBilling.billing_year == year,
+            MonthlyBilling.status != 'cancelled'
+        ).group_by(MonthlyBilling.billing_month, Company.warehouse_code)
+
+        if month is not None:
+            statement = statement.where(MonthlyBilling.billing_month == month)
+
+        if warehouse_code:
+            statement = statement.where(Company.warehouse_code == warehouse_code)
+
+        return statement
+
+    @staticmethod
+    def _sum_won(column):
+        """원 단위 금액 합계 - 정수(int)로 직접 조회 (행마다 Decimal 변환 생략)"""
+        return func.coalesce(func.sum(column, type_=BigInteger), 0)
+
+    @staticmethod
+    def _empty_monthly_summary() -> dict:
+        """빈 월 집계"""
+        return {
+            'total_billing': 0,
+            'total_outsourcing': 0,
+            'total_profit': 0,
+            'count': 0,
+            'by_warehouse': {}
+        }
 
-        return result
+    @staticmethod
+    def _add_summary_row(
+        summary: dict,
+        warehouse_code: Optional[str],
+        billing: int,
+        outsourcing: int,
+        profit: int,
+        count: int
+    ) -> None:
+        """창고별 합계 행을 월 집계에 반영 (int 누적)"""
+        summary['total_billing'] += billing
+        summary['total_outsourcing'] += outsourcing
+        summary['total_profit'] += profit
+        summary['count'] += count
+
+        # 창고 코드 미지정/업체 없음은 'unknown'으로 합산
+        wh_totals = summary['by_warehouse'].setdefault(warehouse_code or 'unknown', {
+            'billing': 0,
+            'outsourcing': 0,
+            'profit': 0,
+            'count': 0
+        })
+        wh_totals['billing'] += billing
+        wh_totals['outsourcing'] += outsourcing
+        wh_totals['profit'] += profit
+        wh_totals['count'] += count
+
+    @staticmethod
+    def _to_decimal_summary(summary: dict) -> dict:
+        """누적된 int 금액을 Decimal로 변환 (건수 제외, 창고별 집계 포함)"""
+        for key in ('total_billing', 'total_outsourcing', 'total_profit'):
+            summary[key] = Decimal(summary[key])
+        for wh_totals in summary.get('by_warehouse', {}).values():
+            for key in ('billing', 'outsourcing', 'profit'):
+                wh_totals[key] = Decimal(wh_totals[key])
+        return summary
@@ -2,26 +2,97 @@
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional, Tuple, Dict, Any
+from os import PathLike
+from typing import List, Optional, Set, Tuple, Dict, Any, Union, BinaryIO
 from pathlib import Path
-import json
 from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-from openpyxl.utils import get_column_letter
-from sqlmodel import Session, select
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
+from openpyxl.utils import get_column_letter, column_index_from_string
+from sqlmodel import Session, select, func
+from sqlalchemy import BigInteger, update
+from sqlalchemy.orm import defer, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from database.models import (
-    Contract, Company, MonthlyBilling, CodeMapping
+    Contract, Company, MonthlyBilling
 )
 from utils.constants import (
     EXCEL_COLUMN_MAPPING, BillingCycle, CompanyType, ContractStatus
 )
 from utils.parsing_utils import (
     parse_date, parse_amount, parse_boolean,
-    parse_warehouse_code, parse_notes_for_rules,
+    parse_warehouse_code, parse_notes_for_rules, parse_purchase_dates,
     is_total_row, extract_period_from_item_name
 )
-from utils.date_utils import parse_billing_timing
+from utils.date_utils import BillingTiming, parse_billing_timing
+from utils.json_utils import dumps_json
+
+
+# 엑셀 입출력 대상 (파일 경로 또는 BytesIO 등 바이너리 파일 객체)
+ExcelFile = Union[str, PathLike, BinaryIO]
+
+# Import 컬럼 매핑 (0-based 컬럼 인덱스, 필드명) - 모듈 로드 시 1회 변환
+_COLUMN_INDEX_FIELDS = tuple(sorted(
+    (column_index_from_string(col_letter) - 1, field_name)
+    for col_letter, field_name in EXCEL_COLUMN_MAPPING.items()
+))
+
+
+def _cell_text(value: Any) -> str:
+    """셀 값 → 텍스트 (빈 셀은 빈 문자열, 문자열은 불필요한 str() 변환 생략)"""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip()
+
+
+# Export/템플릿 공통 스타일 (호출마다 재생성하지 않음)
+_BOLD_FONT = Font(bold=True)
+_HEADER_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+_HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+_THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+
+# 합계 행 명명 스타일 이름
+_TOTALS_STYLE_NAME = "totals_row"
+
+# 열 너비 (A~S 컬럼)
+_COLUMN_WIDTHS = (8, 10, 20, 25, 12, 12, 12, 12, 10, 12, 15, 12, 12, 15, 12, 12, 12, 30, 8)
+
+
+def _new_write_only_sheet(wb: Workbook, headers: List[str], border: Optional[Border] = None):
+    """쓰기 전용 시트 생성 - 열 너비 지정 후 헤더 행 작성 (열 너비는 행 작성 전에만 지정 가능)"""
+    ws = wb.create_sheet("매월 유지보수")
+
+    for col_idx, width in enumerate(_COLUMN_WIDTHS, 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = _BOLD_FONT
+        cell.fill = _HEADER_FILL
+        cell.alignment = _HEADER_ALIGNMENT
+        if border is not None:
+            cell.border = border
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    return ws
+
+
+def _save_workbook(wb: Workbook, target: ExcelFile) -> None:
+    """워크북 저장 후 닫기 (경로이면 상위 폴더 생성, 파일 객체는 그대로 기록)"""
+    if isinstance(target, (str, PathLike)):
+        Path(target).parent.mkdir(parents=True, exist_ok=True)
+    wb.save(target)
+    wb.close()
 
 
 class ExcelEngine:
@@ -36,78 +107,104 @@ class ExcelEngine:
         '매입일자', '특이사항', '자동갱신'
     ]
 
+    # Import 저장 배치 크기 (행) - 대량 Import 시 트랜잭션/메모리 증가 방지
+    IMPORT_BATCH_SIZE = 1000
+
     def __init__(self, session: Session):
         self.session = session
 
+        # 특이사항 파싱 캐시 (원문 기준, 결과 dict는 Import 내에서 읽기 전용으로 공유)
+        # 발행시기는 parse_billing_timing 자체 캐시(불변 결과) 사용
+        self._notes_cache: Dict[str, dict] = {}
+
+        # 파싱 결과 JSON 직렬화 캐시 (id(dict) → (dict, JSON)) - 공유 dict는 1회만 직렬화
+        self._json_cache: Dict[int, Tuple[Any, str]] = {}
+
     def import_from_excel(
         self,
-        file_path: str,
+        file_path: ExcelFile,
         sheet_name: str = "매월 유지보수"
     ) -> Tuple[List[dict], List[dict]]:
         """엑셀에서 데이터 Import
 
         Args:
-            file_path: 엑셀 파일 경로
+            file_path: 엑셀 파일 경로 또는 바이너리 파일 객체 (업로드 파일/BytesIO)
             sheet_name: 시트명
 
         Returns:
             (imported_records, errors)
         """
-        wb = load_workbook(file_path, data_only=True)
-
-        if sheet_name not in wb.sheetnames:
-            # 첫 번째 시트 사용
-            ws = wb.active
-        else:
-            ws = wb[sheet_name]
+        # 읽기 전용(스트리밍) 모드 - Cell 객체를 만들지 않고 행 단위 값만 순회
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+
+        # 파싱 중 예외가 나도 파일 핸들을 닫는다 (읽기 전용 모드는 파일을 연 채로 스트리밍 -
+        # Windows에서 업로드 임시 파일 삭제 실패 방지)
+        try:
+            if sheet_name not in wb.sheetnames:
+                # 첫 번째 시트 사용
+                ws = wb.active
+            else:
+                ws = wb[sheet_name]
 
-        records = []
-        errors = []
+            records = []
+            errors = []
 
-        # 헤더 행 찾기 (첫 번째 행이 헤더라고 가정)
-        header_row = 1
-        headers = [cell.value for cell in ws[header_row]]
+            # 헤더 행 찾기 (첫 번째 행이 헤더라고 가정)
+            header_row = 1
+            rows = ws.iter_rows(min_row=header_row, values_only=True)
+            headers = next(rows, ())
 
-        for row_idx in range(header_row + 1, ws.max_row + 1):
-            row_data = {}
-            row_errors = []
+            # 헤더 범위 내 매핑 컬럼만 추출 (나머지 컬럼 값은 무시)
+            column_fields = [
+                (idx, field_name)
+                for idx, field_name in _COLUMN_INDEX_FIELDS
+                if idx < len(headers)
+            ]
 
-            for col_idx, header in enumerate(headers, 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                col_letter = get_column_letter(col_idx)
+            # 빈 행 판정 컬럼 (업체 코드/업체명) - 헤더 범위 밖이면 항상 빈 값
+            key_indices = [
+                idx for idx, field_name in column_fields
+                if field_name in ('company_code', 'company_name')
+            ]
 
-                if col_letter in EXCEL_COLUMN_MAPPING:
-                    field_name = EXCEL_COLUMN_MAPPING[col_letter]
-                    row_data[field_name] = cell.value
+            for row_idx, row in enumerate(rows, header_row + 1):
+                row_len = len(row)
 
-            # 빈 행 스킵
-            if not row_data.get('company_code') and not row_data.get('company_name'):
-                continue
+                # 빈 행 스킵 (행 dict 생성 전에 원본 튜플에서 판정)
+                if not any(idx < row_len and row[idx] for idx in key_indices):
+                    continue
 
-            # 합계 행 스킵
-            if is_total_row(row_data):
-                break  # 합계 이후는 메모/지침 블록
+                row_errors = []
+                row_data = {
+                    field_name: row[idx] if idx < row_len else None
+                    for idx, field_name in column_fields
+                }
 
-            # 데이터 파싱 및 변환
-            parsed_record, parse_errors = self._parse_row_data(row_data, row_idx)
+                # 합계 행 스킵
+                if is_total_row(row_data):
+                    break  # 합계 이후는 메모/지침 블록
 
-            if parse_errors:
-                row_errors.extend(parse_errors)
+                # 데이터 파싱 및 변환
+                parsed_record, parse_errors = self._parse_row_data(row_data, row_idx)
 
-            records.append({
-                'row': row_idx,
-                'raw_data': row_data,
-                'parsed_data': parsed_record,
-                'errors': row_errors
-            })
+                if parse_errors:
+                    row_errors.extend(parse_errors)
 
-            if row_errors:
-                errors.extend([{
+                records.append({
                     'row': row_idx,
-                    'error': e
-                } for e in row_errors])
+                    'raw_data': row_data,
+                    'parsed_data': parsed_record,
+                    'errors': row_errors
+                })
+
+                if row_errors:
+                    errors.extend([{
+                        'row': row_idx,
+                        'error': e
+                    } for e in row_errors])
+        finally:
+            wb.close()
 
-        wb.close()
         return (records, errors)
 
     def _parse_row_data(
@@ -126,9 +223,9 @@ class ExcelEngine:
             errors.append(wh_error)
 
         # 업체 코드/명
-        parsed['company_code'] = str(row_data.get('company_code', '')).strip()
-        parsed['company_name'] = str(row_data.get('company_name', '')).strip()
-        parsed['item_name'] = str(row_data.get('item_name', '')).strip()
+        parsed['company_code'] = _cell_text(row_data.get('company_code'))
+        parsed['company_name'] = _cell_text(row_data.get('company_name'))
+        parsed['item_name'] = _cell_text(row_data.get('item_name'))
 
         # 계약기간
         start_date, start_error = parse_date(row_data.get('contract_start_date'))
@@ -161,7 +258,7 @@ class ExcelEngine:
         parsed['total_amount'] = total_amt or Decimal("0")
 
         # 외주
-        parsed['outsourcing_company'] = str(row_data.get('outsourcing_company', '')).strip()
+        parsed['outsourcing_company'] = _cell_text(row_data.get('outsourcing_company'))
         outsourcing_amt, outsourcing_err, _ = parse_amount(row_data.get('outsourcing_amount'))
         parsed['outsourcing_amount'] = outsourcing_amt or Decimal("0")
         if outsourcing_err:
@@ -171,7 +268,7 @@ class ExcelEngine:
         parsed['profit'] = profit_amt or Decimal("0")
 
         # 발행시기
-        billing_timing = str(row_data.get('billing_timing', '')).strip()
+        billing_timing = _cell_text(row_data.get('billing_timing'))
         parsed['billing_timing'] = billing_timing
         parsed['billing_timing_parsed'] = parse_billing_timing(billing_timing)
 
@@ -183,16 +280,19 @@ class ExcelEngine:
         parsed['request_date'] = request_date
 
         # 매입일자 (다건 허용)
-        from utils.parsing_utils import parse_purchase_dates
         purchase_dates, purchase_err = parse_purchase_dates(row_data.get('purchase_date'))
         parsed['purchase_dates'] = purchase_dates
         if purchase_err:
             errors.append(purchase_err)
 
         # 특이사항
-        notes = str(row_data.get('notes', '')).strip()
+        notes = _cell_text(row_data.get('notes'))
         parsed['notes'] = notes
-        parsed['notes_parsed'] = parse_notes_for_rules(notes)
+        notes_parsed = self._notes_cache.get(notes)
+        if notes_parsed is None:
+            notes_parsed = parse_notes_for_rules(notes)
+            self._notes_cache[notes] = notes_parsed
+        parsed['notes_parsed'] = notes_parsed
 
         # 자동갱신
         parsed['auto_renewal'] = parse_boolean(row_data.get('auto_renewal'))
@@ -211,6 +311,10 @@ class ExcelEngine:
     ) -> Tuple[int, int, List[str]]:
         """Import된 데이터 저장
 
+        업체/계약은 행마다 조회하지 않고 IN 조건 일괄 조회 후 dict로 매칭하며,
+        신규 업체/계약은 행마다 flush하지 않고 모아서 IMPORT_BATCH_SIZE 행 단위로
+        커밋한다. 배치 저장 실패 시 해당 배치만 롤백하고 다음 배치를 계속 처리한다.
+
         Returns:
             (created_count, updated_count, errors)
         """
@@ -218,120 +322,215 @@ class ExcelEngine:
         updated = 0
         errors = []
 
-        for record in records:
-            if record.get('errors'):
-                continue  # 에러가 있는 행 스킵
+        valid_records = [record for record in records if not record.get('errors')]  # 에러가 있는 행 스킵
+        companies, contracts = self._load_existing_for_import(
+            [record['parsed_data'] for record in valid_records]
+        )
 
-            parsed = record['parsed_data']
+        # 배치 커밋 후에도 조회해 둔 업체/계약을 재조회하지 않도록 만료 생략
+        expire_on_commit = self.session.expire_on_commit
+        self.session.expire_on_commit = False
+        try:
+            for batch_start in range(0, len(valid_records), self.IMPORT_BATCH_SIZE):
+                batch = valid_records[batch_start:batch_start + self.IMPORT_BATCH_SIZE]
+                new_companies: List[Company] = []
+                new_contracts: List[Contract] = []
+                update_mappings: Dict[int, dict] = {}  # 계약 id → 변경 컬럼 (계약당 1건으로 병합)
+                pending_updated: Set[int] = set()  # 변경된 미저장 신규 계약 (id(객체))
+                batch_created = 0
+                batch_updated = 0
+
+                for record in batch:
+                    parsed = record['parsed_data']
+
+                    try:
+                        # 업체 조회/생성
+                        company = companies.get(parsed['company_code'])
+                        if company is None:
+                            company = self._create_company(
+                                parsed['company_code'],
+                                parsed['company_name'],
+                                parsed['warehouse_code']
+                            )
+                            companies[company.code] = company
+                            new_companies.append(company)
+
+                        # 계약 조회/생성
+                        contract_key = (company.code, parsed['item_name'])
+                        contract = contracts.get(contract_key)
+                        if contract is None:
+                            contract = self._create_contract(company, parsed)
+                            contracts[contract_key] = contract
+                            new_contracts.append(contract)
+                            batch_created += 1
+                        elif update_existing:
+                            changes = self._update_contract(contract, parsed)
+                            if changes and contract.id is None:
+                                # 같은 배치에서 생성된 미저장 계약 - 변경값이 INSERT에 반영되므로
+                                # UPDATE 대상에서 제외
+                                if id(contract) not in pending_updated:
+                                    pending_updated.add(id(contract))
+                                    batch_updated += 1
+                            elif changes:
+                                if contract.id not in update_mappings:
+                                    batch_updated += 1
+                                update_mappings.setdefault(
+                                    contract.id, {'id': contract.id}
+                                ).update(changes)
+
+                    except Exception as e:
+                        errors.append(f"Row {record['row']}: {str(e)}")
+
+                # 신규 업체 → 계약 순서로 배치 단위 일괄 INSERT,
+                # 기존 계약 변경분은 기본키 기준 executemany UPDATE
+                try:
+                    self.session.add_all(new_companies)
+                    self.session.add_all(new_contracts)
+                    if update_mappings:
+                        self.session.execute(update(Contract), list(update_mappings.values()))
+                    self.session.commit()
+                except Exception as e:
+                    self.session.rollback()
+                    # 저장되지 않은 신규 업체/계약은 이후 배치에서 다시 생성되도록 제거
+                    for company in new_companies:
+                        companies.pop(company.code, None)
+                    failed_ids = {id(contract) for contract in new_contracts}
+                    for contract_key, contract in list(contracts.items()):
+                        if id(contract) in failed_ids:
+                            del contracts[contract_key]
+                    errors.append(
+                        f"Row {batch[0]['row']}~{batch[-1]['row']}: 배치 저장 실패 ({str(e)})"
+                    )
+                    continue
+
+                created += batch_created
+                updated += batch_updated
+        finally:
+            self.session.expire_on_commit = expire_on_commit
 
-            try:
-                # 업체 조회/생성
-                company = self._get_or_create_company(
-                    parsed['company_code'],
-                    parsed['company_name'],
-                    parsed['warehouse_code']
-                )
+        return (created, updated, errors)
 
-                # 계약 조회/생성
-                contract = self._get_or_create_contract(
-                    company, parsed, update_existing
-                )
+    def _dumps_json(self, value: Union[dict, BillingTiming]) -> str:
+        """파싱 결과 JSON 직렬화 (동일 객체는 캐시 사용)"""
+        cached = self._json_cache.get(id(value))
+        if cached is not None and cached[0] is value:
+            return cached[1]
 
-                if contract.id:
-                    updated += 1
-                else:
-                    created += 1
+        text = dumps_json(value._asdict() if isinstance(value, BillingTiming) else value)
+        self._json_cache[id(value)] = (value, text)
+        return text
 
-            except Exception as e:
-                errors.append(f"Row {record['row']}: {str(e)}")
+    def _load_existing_for_import(
+        self,
+        parsed_records: List[dict]
+    ) -> Tuple[Dict[str, Company], Dict[Tuple[str, str], Contract]]:
+        """Import 대상 업체/계약 일괄 조회
 
-        self.session.commit()
-        return (created, updated, errors)
+        Returns:
+            ({업체코드: 업체}, {(업체코드, 품목명): 계약}) - 동일 키 중복 시 먼저 등록된 건 사용
+        """
+        codes = {parsed['company_code'] for parsed in parsed_records}
+        if not codes:
+            return ({}, {})
+
+        companies: Dict[str, Company] = {}
+        for company in self.session.exec(
+            select(Company).where(Company.code.in_(codes)).order_by(Company.id)
+        ).all():
+            companies.setdefault(company.code, company)
+
+        company_codes = {company.id: code for code, company in companies.items()}
+        contracts: Dict[Tuple[str, str], Contract] = {}
+        if company_codes:
+            item_names = {parsed['item_name'] for parsed in parsed_records}
+            for contract in self.session.exec(
+                select(Contract).where(
+                    Contract.company_id.in_(company_codes),
+                    Contract.item_name.in_(item_names)
+                ).order_by(Contract.id)
+            ).all():
+                contracts.setdefault(
+                    (company_codes[contract.company_id], contract.item_name), contract
+                )
 
-    def _get_or_create_company(
+        return (companies, contracts)
+
+    def _create_company(
         self,
         code: str,
         name: str,
         warehouse_code: Optional[str]
     ) -> Company:
-        """업체 조회 또는 생성"""
-        statement = select(Company).where(Company.code == code)
-        company = self.session.exec(statement).first()
-
-        if not company:
-            company = Company(
-                code=code,
-                name=name,
-                company_type=CompanyType.SALES.value,
-                warehouse_code=warehouse_code
-            )
-            self.session.add(company)
-            self.session.flush()
+        """업체 생성 (세션 추가는 호출측에서 일괄 처리)"""
+        return Company(
+            code=code,
+            name=name,
+            company_type=CompanyType.SALES.value,
+            warehouse_code=warehouse_code
+        )
 
-        return company
+    def _update_contract(self, contract: Contract, parsed: dict) -> dict:
+        """기존 계약 변경분 산출 (변경된 값이 있을 때만)
 
-    def _get_or_create_contract(
-        self,
-        company: Company,
-        parsed: dict,
-        update_existing: bool
-    ) -> Contract:
-        """계약 조회 또는 생성"""
-        statement = select(Contract).where(
-            Contract.company_id == company.id,
-            Contract.item_name == parsed['item_name']
+        DB 반영은 호출측의 일괄 UPDATE로 처리하고, 세션 내 계약 객체에는 변경값을
+        커밋된 값으로 반영해 같은 Import 내 이후 행 비교에 사용한다.
+        아직 저장되지 않은 신규 계약(id 없음)은 속성에 그대로 반영해 INSERT 값에 포함시킨다.
+
+        Returns:
+            변경 컬럼 dict (updated_at 포함) - 동일 내용 재Import 시 빈 dict
+        """
+        values = {
+            'contract_start': parsed['contract_start'],
+            'contract_end': parsed['contract_end'],
+            'monthly_amount': parsed['monthly_amount'],
+            'billing_timing': parsed['billing_timing'],
+            'billing_timing_parsed': self._dumps_json(parsed['billing_timing_parsed']),
+            'auto_renewal': parsed['auto_renewal'],
+            'notes': parsed['notes'],
+            'notes_parsed': self._dumps_json(parsed['notes_parsed']),
+        }
+
+        changes = {
+            field: value for field, value in values.items()
+            if getattr(contract, field) != value
+        }
+        if not changes:
+            return {}
+
+        changes['updated_at'] = datetime.now()
+        apply = setattr if contract.id is None else set_committed_value
+        for field, value in changes.items():
+            apply(contract, field, value)
+        return changes
+
+    def _create_contract(self, company: Company, parsed: dict) -> Contract:
+        """새 계약 생성 (세션 추가는 호출측에서 일괄 처리)"""
+        status = ContractStatus.ACTIVE.value
+        if parsed['contract_start'] is None and parsed['contract_end'] is None:
+            status = ContractStatus.PERIOD_UNDEFINED.value
+
+        # 역발행 체크
+        is_reverse = (
+            parsed['billing_timing_parsed'].is_reverse_billing or
+            parsed['notes_parsed'].get('is_reverse_billing', False)
         )
-        contract = self.session.exec(statement).first()
-
-        if contract and update_existing:
-            # 기존 계약 업데이트
-            contract.contract_start = parsed['contract_start']
-            contract.contract_end = parsed['contract_end']
-            contract.monthly_amount = parsed['monthly_amount']
-            contract.billing_timing = parsed['billing_timing']
-            contract.billing_timing_parsed = json.dumps(
-                parsed['billing_timing_parsed'], ensure_ascii=False
-            )
-            contract.auto_renewal = parsed['auto_renewal']
-            contract.notes = parsed['notes']
-            contract.notes_parsed = json.dumps(
-                parsed['notes_parsed'], ensure_ascii=False
-            )
-            contract.updated_at = datetime.now()
-
-        elif not contract:
-            # 새 계약 생성
-            status = ContractStatus.ACTIVE.value
-            if parsed['contract_start'] is None and parsed['contract_end'] is None:
-                status = ContractStatus.PERIOD_UNDEFINED.value
-
-            # 역발행 체크
-            is_reverse = (
-                parsed['billing_timing_parsed'].get('is_reverse_billing', False) or
-                parsed['notes_parsed'].get('is_reverse_billing', False)
-            )
 
-            contract = Contract(
-                company_id=company.id,
-                item_name=parsed['item_name'],
-                contract_start=parsed['contract_start'],
-                contract_end=parsed['contract_end'],
-                monthly_amount=parsed['monthly_amount'],
-                billing_timing=parsed['billing_timing'],
-                billing_timing_parsed=json.dumps(
-                    parsed['billing_timing_parsed'], ensure_ascii=False
-                ),
-                auto_renewal=parsed['auto_renewal'],
-                is_reverse_billing=is_reverse,
-                default_outsourcing_amount=parsed['outsourcing_amount'],
-                status=status,
-                notes=parsed['notes'],
-                notes_parsed=json.dumps(
-                    parsed['notes_parsed'], ensure_ascii=False
-                )
-            )
-            self.session.add(contract)
-            self.session.flush()
+        contract = Contract(
+            item_name=parsed['item_name'],
+            contract_start=parsed['contract_start'],
+            contract_end=parsed['contract_end'],
+            monthly_amount=parsed['monthly_amount'],
+            billing_timing=parsed['billing_timing'],
+            billing_timing_parsed=self._dumps_json(parsed['billing_timing_parsed']),
+            auto_renewal=parsed['auto_renewal'],
+            is_reverse_billing=is_reverse,
+            default_outsourcing_amount=parsed['outsourcing_amount'],
+            status=status,
+            notes=parsed['notes'],
+            notes_parsed=self._dumps_json(parsed['notes_parsed'])
+        )
+        # 신규 업체는 아직 id가 없으므로 관계로 연결 (INSERT 시 company_id 반영)
+        contract.company = company
 
         return contract
 
@@ -339,66 +538,35 @@ class ExcelEngine:
         self,
         year: int,
         month: int,
-        file_path: str
-    ) -> str:
+        file_path: ExcelFile
+    ) -> ExcelFile:
         """월별 청구 엑셀 Export
 
         Args:
             year: 청구년도
             month: 청구월
-            file_path: 저장 경로
+            file_path: 저장 경로 또는 바이너리 파일 객체 (BytesIO)
 
         Returns:
-            저장된 파일 경로
+            저장 대상 (전달받은 경로/파일 객체)
         """
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "매월 유지보수"
-
-        # 헤더 스타일
-        header_font = Font(bold=True)
-        header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-        header_alignment = Alignment(horizontal='center', vertical='center')
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
-        # 헤더 작성
-        for col_idx, header in enumerate(self.TEMPLATE_HEADERS, 1):
-            cell = ws.cell(row=1, column=col_idx)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
+        # 쓰기 전용(스트리밍) 워크북 - 행을 메모리에 Cell 객체로 보관하지 않음
+        wb = Workbook(write_only=True)
+        ws = _new_write_only_sheet(wb, self.TEMPLATE_HEADERS, border=_THIN_BORDER)
 
-        # 청구 데이터 조회
+        # 청구 데이터 조회 (Export에 쓰이지 않는 경고 JSON/메모는 로드 생략,
+        # 계약/업체는 행별 지연 로드 대신 일괄 로드)
         statement = select(MonthlyBilling).where(
             MonthlyBilling.billing_year == year,
             MonthlyBilling.billing_month == month
+        ).options(
+            defer(MonthlyBilling.warnings), defer(MonthlyBilling.notes),
+            selectinload(MonthlyBilling.contract).selectinload(Contract.company)
         ).order_by(MonthlyBilling.id)
 
         billings = self.session.exec(statement).all()
 
-        # 코드 매핑 조회
-        code_mappings = {
-            cm.code: cm.name
-            for cm in self.session.exec(select(CodeMapping)).all()
-        }
-
-        # 데이터 작성
-        row_idx = 2
-        totals = {
-            'billing_amount': Decimal("0"),
-            'vat_amount': Decimal("0"),
-            'total_amount': Decimal("0"),
-            'outsourcing_amount': Decimal("0"),
-            'profit': Decimal("0")
-        }
-
+        # 데이터 작성 (행 단위 append - 셀 좌표 조회 생략, 금액은 원 단위 정수)
         for billing in billings:
             contract = billing.contract
             if not contract:
@@ -406,110 +574,84 @@ class ExcelEngine:
 
             company = contract.company
 
-            # 창고 코드
-            warehouse_code = company.warehouse_code if company else ""
-            ws.cell(row=row_idx, column=1).value = warehouse_code
-
-            # 업체 정보
-            ws.cell(row=row_idx, column=2).value = company.code if company else ""
-            ws.cell(row=row_idx, column=3).value = company.name if company else ""
-            ws.cell(row=row_idx, column=4).value = contract.item_name
-
-            # 계약기간
-            ws.cell(row=row_idx, column=5).value = contract.contract_start
-            ws.cell(row=row_idx, column=6).value = contract.contract_end
-
-            # 금액
-            ws.cell(row=row_idx, column=7).value = float(contract.monthly_amount)
-            ws.cell(row=row_idx, column=8).value = float(billing.final_amount)
-            ws.cell(row=row_idx, column=9).value = float(billing.vat_amount)
-            ws.cell(row=row_idx, column=10).value = float(billing.total_amount)
-
-            # 외주
-            ws.cell(row=row_idx, column=11).value = ""  # 외주업체명은 별도 조회 필요
-            ws.cell(row=row_idx, column=12).value = float(billing.outsourcing_amount)
-            ws.cell(row=row_idx, column=13).value = float(billing.profit)
-
-            # 발행시기
-            if contract.is_reverse_billing:
-                ws.cell(row=row_idx, column=14).value = "역발행"
-            else:
-                ws.cell(row=row_idx, column=14).value = contract.billing_timing
-
-            # 일자
-            ws.cell(row=row_idx, column=15).value = billing.sales_date
-            ws.cell(row=row_idx, column=16).value = billing.request_date
-            ws.cell(row=row_idx, column=17).value = None  # 매입일자
-
-            # 특이사항
-            ws.cell(row=row_idx, column=18).value = contract.notes
-
-            # 자동갱신
-            ws.cell(row=row_idx, column=19).value = "O" if contract.auto_renewal else "X"
-
-            # 합계 누적
-            totals['billing_amount'] += billing.final_amount
-            totals['vat_amount'] += billing.vat_amount
-            totals['total_amount'] += billing.total_amount
-            totals['outsourcing_amount'] += billing.outsourcing_amount
-            totals['profit'] += billing.profit
-
-            row_idx += 1
-
-        # 합계 행
-        ws.cell(row=row_idx, column=3).value = "합계"
-        ws.cell(row=row_idx, column=3).font = Font(bold=True)
-        ws.cell(row=row_idx, column=8).value = float(totals['billing_amount'])
-        ws.cell(row=row_idx, column=9).value = float(totals['vat_amount'])
-        ws.cell(row=row_idx, column=10).value = float(totals['total_amount'])
-        ws.cell(row=row_idx, column=12).value = float(totals['outsourcing_amount'])
-        ws.cell(row=row_idx, column=13).value = float(totals['profit'])
-
-        # 합계 행 스타일
-        for col_idx in range(1, 20):
-            cell = ws.cell(row=row_idx, column=col_idx)
-            cell.border = thin_border
-            cell.font = Font(bold=True)
-
-        # 열 너비 조정
-        column_widths = [8, 10, 20, 25, 12, 12, 12, 12, 10, 12, 15, 12, 12, 15, 12, 12, 12, 30, 8]
-        for col_idx, width in enumerate(column_widths, 1):
-            ws.column_dimensions[get_column_letter(col_idx)].width = width
+            ws.append((
+                # 창고 코드 / 업체 정보
+                company.warehouse_code if company else "",
+                company.code if company else "",
+                company.name if company else "",
+                contract.item_name,
+                # 계약기간
+                contract.contract_start,
+                contract.contract_end,
+                # 금액
+                int(contract.monthly_amount),
+                int(billing.final_amount),
+                int(billing.vat_amount),
+                int(billing.total_amount),
+                # 외주 (외주업체명은 별도 조회 필요)
+                "",
+                int(billing.outsourcing_amount),
+                int(billing.profit),
+                # 발행시기
+                "역발행" if contract.is_reverse_billing else contract.billing_timing,
+                # 일자 (매입일자 없음)
+                billing.sales_date,
+                billing.request_date,
+                None,
+                # 특이사항 / 자동갱신
+                contract.notes,
+                "O" if contract.auto_renewal else "X",
+            ))
+
+        # 합계 행 (DB SUM 집계, 스타일 적용)
+        billing_sum, vat_sum, total_sum, outsourcing_sum, profit_sum = self.session.exec(
+            select(
+                *(func.coalesce(func.sum(column, type_=BigInteger), 0) for column in (
+                    MonthlyBilling.final_amount,
+                    MonthlyBilling.vat_amount,
+                    MonthlyBilling.total_amount,
+                    MonthlyBilling.outsourcing_amount,
+                    MonthlyBilling.profit
+                ))
+            ).select_from(MonthlyBilling).join(
+                Contract, MonthlyBilling.contract_id == Contract.id
+            ).where(
+                MonthlyBilling.billing_year == year,
+                MonthlyBilling.billing_month == month
+            )
+        ).one()
+
+        total_values = (
+            None, None, "합계", None, None, None, None,
+            billing_sum,
+            vat_sum,
+            total_sum,
+            None,
+            outsourcing_sum,
+            profit_sum,
+        )
+        # 합계 행 서식은 워크북에 명명 스타일로 1회 등록 후 셀마다 이름으로 참조
+        wb.add_named_style(
+            NamedStyle(name=_TOTALS_STYLE_NAME, font=_BOLD_FONT, border=_THIN_BORDER)
+        )
+        total_cells = []
+        for col_idx in range(19):
+            cell = WriteOnlyCell(
+                ws, value=total_values[col_idx] if col_idx < len(total_values) else None
+            )
+            cell.style = _TOTALS_STYLE_NAME
+            total_cells.append(cell)
+        ws.append(total_cells)
 
         # 저장
-        output_path = Path(file_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        wb.save(file_path)
-        wb.close()
+        _save_workbook(wb, file_path)
 
         return file_path
 
-    def create_template(self, file_path: str) -> str:
-        """빈 템플릿 생성"""
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "매월 유지보수"
-
-        # 헤더 스타일
-        header_font = Font(bold=True)
-        header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-        header_alignment = Alignment(horizontal='center', vertical='center')
-
-        for col_idx, header in enumerate(self.TEMPLATE_HEADERS, 1):
-            cell = ws.cell(row=1, column=col_idx)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-
-        # 열 너비
-        column_widths = [8, 10, 20, 25, 12, 12, 12, 12, 10, 12, 15, 12, 12, 15, 12, 12, 12, 30, 8]
-        for col_idx, width in enumerate(column_widths, 1):
-            ws.column_dimensions[get_column_letter(col_idx)].width = width
-
-        output_path = Path(file_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        wb.save(file_path)
-        wb.close()
+    def create_template(self, file_path: ExcelFile) -> ExcelFile:
+        """빈 템플릿 생성 (쓰기 전용 워크북, 헤더 행만 작성)"""
+        wb = Workbook(write_only=True)
+        _new_write_only_sheet(wb, self.TEMPLATE_HEADERS)
+        _save_workbook(wb, file_path)
 
         return file_path
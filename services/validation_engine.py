@@ -1,163 +1,237 @@
 """검증 엔진 - 누락/오류 방지 검증 로직"""
 
 from datetime import date
-from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Dict, Tuple
 import json
-from sqlmodel import Session, select
+from sqlmodel import Session, select, func, and_, or_
+from sqlalchemy import tuple_
+from sqlalchemy.orm import selectinload
 
-from database.models import (
-    Contract, ContractHistory, MonthlyBilling, Company
-)
+from database.models import Contract, MonthlyBilling, Company
 from utils.constants import (
-    ContractStatus, BillingStatus, SUDDEN_CHANGE_THRESHOLD_PERCENT
+    ContractStatus, BillingStatus, BillingCycle, SUDDEN_CHANGE_THRESHOLD_PERCENT,
+    BILLABLE_CONTRACT_STATUSES, BILLING_CYCLE_TARGET_MONTH_MASK_BY_VALUE
 )
 from utils.date_utils import (
     calculate_contract_period_status,
-    parse_billing_timing,
-    get_last_day_of_month
+    parse_billing_timing
 )
 
 
+@dataclass(frozen=True, slots=True)
+class ValidationWarning:
+    """검증 경고 (규칙 코드, 수준 error/warning/info, 메시지)"""
+    code: str
+    level: str
+    message: str
+
+    def to_dict(self) -> dict:
+        """JSON 저장/화면 표시용 dict 변환"""
+        return {'code': self.code, 'level': self.level, 'message': self.message}
+
+
+# (계약 ID, 청구년, 청구월) → 취소 제외 청구 목록
+RelatedBillings = Dict[Tuple[int, int, int], List[MonthlyBilling]]
+
+
+def group_warnings_by_code(
+    warnings: Iterable[ValidationWarning]
+) -> Dict[str, List[ValidationWarning]]:
+    """경고를 규칙 코드별로 묶음 (코드 조회/존재 확인을 목록 순회 없이 처리)
+
+    validate_billing은 저장/표시 순서 유지를 위해 목록을 반환하므로,
+    코드 기준 조회가 필요한 호출자는 이 함수로 변환하여 사용한다.
+    """
+    grouped: Dict[str, List[ValidationWarning]] = defaultdict(list)
+    for warning in warnings:
+        grouped[warning.code].append(warning)
+    return dict(grouped)
+
+
+def _previous_month(year: int, month: int) -> Tuple[int, int]:
+    """전월 (년, 월)"""
+    if month == 1:
+        return year - 1, 12
+    return year, month - 1
+
+
 class ValidationEngine:
     """검증 엔진 - 사내 표준 10개 검증 규칙"""
 
     def __init__(self, session: Session):
         self.session = session
 
-    def validate_billing(
+        # 청구 규칙(notes_parsed) 파싱 캐시 (JSON 문자열 기준, 월 일괄 검증 시 반복 파싱 방지)
+        self._rules_cache: Dict[str, dict] = {}
+
+    def validate_billings_bulk(
         self,
-        billing: MonthlyBilling,
-        contract: Contract
-    ) -> List[dict]:
-        """청구 검증 (모든 규칙 적용)
+        pairs: List[Tuple[MonthlyBilling, Contract]]
+    ) -> List[List[ValidationWarning]]:
+        """여러 청구 일괄 검증
+
+        전월/동월 청구를 한 번에 조회하여 청구별 개별 조회(N+1)를 없앤다.
 
         Returns:
-            List of warning dicts: [{'code': str, 'level': str, 'message': str}]
+            pairs 순서대로 청구별 경고 목록
         """
-        warnings = []
-
-        # 1. 계약기간 미확정 경고
-        warnings.extend(self._check_undefined_period(contract))
-
-        # 2. 발행시기 파싱 불가
-        warnings.extend(self._check_billing_timing(contract))
-
-        # 3. 금액 급변 탐지
-        warnings.extend(self._check_sudden_amount_change(billing, contract))
+        related = self._load_related_billings(pairs)
+        return [
+            self.validate_billing(billing, contract, related)
+            for billing, contract in pairs
+        ]
 
-        # 4. 외주금액 미입력
-        warnings.extend(self._check_outsourcing_missing(billing, contract))
-
-        # 5. 중복 청구 가능성
-        warnings.extend(self._check_duplicate_risk(billing, contract))
+    def _load_related_billings(
+        self,
+        pairs: List[Tuple[MonthlyBilling, Contract]]
+    ) -> RelatedBillings:
+        """검증 대상 계약들의 동월/전월 청구 일괄 조회 (취소 제외)"""
+        related: RelatedBillings = {}
+        contract_ids = set()
+        periods = set()
+        for billing, contract in pairs:
+            if contract.status not in BILLABLE_CONTRACT_STATUSES:
+                continue  # 조회 규칙 생략 대상
+            contract_ids.add(contract.id)
+            periods.add((billing.billing_year, billing.billing_month))
+            periods.add(_previous_month(billing.billing_year, billing.billing_month))
+
+        if not contract_ids:
+            return related
 
-        # 6. 역발행 규칙 체크
-        warnings.extend(self._check_reverse_billing(billing, contract))
+        statement = select(MonthlyBilling).where(
+            MonthlyBilling.contract_id.in_(contract_ids),
+            tuple_(MonthlyBilling.billing_year, MonthlyBilling.billing_month).in_(periods),
+            MonthlyBilling.status != BillingStatus.CANCELLED.value
+        ).order_by(MonthlyBilling.id)
 
-        # 7. PO/첨부 필수 체크
-        warnings.extend(self._check_billing_rules(contract))
+        for row in self.session.exec(statement):
+            key = (row.contract_id, row.billing_year, row.billing_month)
+            related.setdefault(key, []).append(row)
 
-        # 8. 계약 만료 임박
-        warnings.extend(self._check_expiring_contract(billing, contract))
+        return related
 
-        # 9. 이전 월 미확정 청구
-        warnings.extend(self._check_previous_unconfirmed(billing))
+    def validate_billing(
+        self,
+        billing: MonthlyBilling,
+        contract: Contract,
+        related: Optional[RelatedBillings] = None
+    ) -> List[ValidationWarning]:
+        """청구 검증 (모든 규칙 적용)
 
-        # 10. 자동갱신 롤링 상태
-        warnings.extend(self._check_auto_renewal_status(billing, contract))
+        Args:
+            related: 일괄 조회된 동월/전월 청구 (없으면 규칙별 개별 조회)
 
-        return warnings
+        청구 불가 상태(만료/해지) 계약은 DB 조회가 필요한 규칙(3, 5, 9)을 생략한다.
 
-    def _check_undefined_period(self, contract: Contract) -> List[dict]:
+        Returns:
+            규칙 순서대로의 ValidationWarning 목록
+        """
+        billable = contract.status in BILLABLE_CONTRACT_STATUSES
+        billing_date = date(billing.billing_year, billing.billing_month, 1)
+
+        return list(chain(
+            # 1. 계약기간 미확정 경고
+            self._check_undefined_period(contract),
+            # 2. 발행시기 파싱 불가
+            self._check_billing_timing(contract),
+            # 3. 금액 급변 탐지
+            self._check_sudden_amount_change(billing, contract, related) if billable else (),
+            # 4. 외주금액 미입력
+            self._check_outsourcing_missing(billing, contract),
+            # 5. 중복 청구 가능성
+            self._check_duplicate_risk(billing, contract, related) if billable else (),
+            # 6. 역발행 규칙 체크
+            self._check_reverse_billing(billing, contract),
+            # 7. PO/첨부 필수 체크
+            self._check_billing_rules(contract),
+            # 8. 계약 만료 임박
+            self._check_expiring_contract(billing, contract, billing_date),
+            # 9. 이전 월 미확정 청구
+            self._check_previous_unconfirmed(billing, related) if billable else (),
+            # 10. 자동갱신 롤링 상태
+            self._check_auto_renewal_status(billing, contract, billing_date),
+        ))
+
+    def _check_undefined_period(self, contract: Contract) -> Iterator[ValidationWarning]:
         """1. 계약기간 미확정 경고"""
-        warnings = []
-
         if contract.contract_start is None or contract.contract_end is None:
-            warnings.append({
-                'code': 'PERIOD_UNDEFINED',
-                'level': 'warning',
-                'message': '계약기간 미확정 - 청구 가능하나 확인 필요'
-            })
+            yield ValidationWarning(
+                code='PERIOD_UNDEFINED',
+                level='warning',
+                message='계약기간 미확정 - 청구 가능하나 확인 필요'
+            )
 
         if contract.status == ContractStatus.PERIOD_UNDEFINED.value:
-            warnings.append({
-                'code': 'STATUS_PERIOD_UNDEFINED',
-                'level': 'warning',
-                'message': '계약 상태가 "계약기간 미확정"입니다'
-            })
-
-        return warnings
+            yield ValidationWarning(
+                code='STATUS_PERIOD_UNDEFINED',
+                level='warning',
+                message='계약 상태가 "계약기간 미확정"입니다'
+            )
 
-    def _check_billing_timing(self, contract: Contract) -> List[dict]:
+    def _check_billing_timing(self, contract: Contract) -> Iterator[ValidationWarning]:
         """2. 발행시기 파싱 불가"""
-        warnings = []
-
         if contract.billing_timing:
             parsed = parse_billing_timing(contract.billing_timing)
 
-            if parsed['requires_manual']:
-                warnings.append({
-                    'code': 'TIMING_MANUAL_REQUIRED',
-                    'level': 'warning',
-                    'message': f'수동 발행일 지정 필요: "{contract.billing_timing}"'
-                })
-
-            if not parsed['parsed'] and not parsed['requires_manual']:
-                warnings.append({
-                    'code': 'TIMING_PARSE_FAILED',
-                    'level': 'warning',
-                    'message': f'발행시기 파싱 실패: "{contract.billing_timing}"'
-                })
+            if parsed.requires_manual:
+                yield ValidationWarning(
+                    code='TIMING_MANUAL_REQUIRED',
+                    level='warning',
+                    message=f'수동 발행일 지정 필요: "{contract.billing_timing}"'
+                )
 
-        return warnings
+            if not parsed.parsed and not parsed.requires_manual:
+                yield ValidationWarning(
+                    code='TIMING_PARSE_FAILED',
+                    level='warning',
+                    message=f'발행시기 파싱 실패: "{contract.billing_timing}"'
+                )
 
     def _check_sudden_amount_change(
         self,
         billing: MonthlyBilling,
-        contract: Contract
-    ) -> List[dict]:
+        contract: Contract,
+        related: Optional[RelatedBillings] = None
+    ) -> Iterator[ValidationWarning]:
         """3. 금액 급변 탐지 (전월 대비 30% 이상)"""
-        warnings = []
-
         # 전월 청구 조회
-        prev_month = billing.billing_month - 1
-        prev_year = billing.billing_year
-        if prev_month == 0:
-            prev_month = 12
-            prev_year -= 1
-
-        statement = select(MonthlyBilling).where(
-            MonthlyBilling.contract_id == contract.id,
-            MonthlyBilling.billing_year == prev_year,
-            MonthlyBilling.billing_month == prev_month,
-            MonthlyBilling.status != BillingStatus.CANCELLED.value
-        )
-        prev_billing = self.session.exec(statement).first()
-
-        if prev_billing and prev_billing.final_amount > 0:
-            change_rate = abs(
-                (billing.final_amount - prev_billing.final_amount) /
-                prev_billing.final_amount * 100
-            )
-
-            if change_rate >= SUDDEN_CHANGE_THRESHOLD_PERCENT:
-                warnings.append({
-                    'code': 'AMOUNT_SUDDEN_CHANGE',
-                    'level': 'warning',
-                    'message': f'금액 급변 감지: 전월 {prev_billing.final_amount:,.0f}원 → 이번달 {billing.final_amount:,.0f}원 ({change_rate:.1f}% 변동)'
-                })
-
-        return warnings
+        prev_year, prev_month = _previous_month(billing.billing_year, billing.billing_month)
+
+        if related is not None:
+            prev_billings = related.get((contract.id, prev_year, prev_month))
+            prev_amount = prev_billings[0].final_amount if prev_billings else None
+        else:
+            # 전월 금액만 필요하므로 금액 컬럼 1건만 조회
+            statement = select(MonthlyBilling.final_amount).where(
+                MonthlyBilling.contract_id == contract.id,
+                MonthlyBilling.billing_year == prev_year,
+                MonthlyBilling.billing_month == prev_month,
+                MonthlyBilling.status != BillingStatus.CANCELLED.value
+            ).limit(1)
+            prev_amount = self.session.exec(statement).first()
+
+        if prev_amount is not None and prev_amount > 0:
+            # 나눗셈 없이 비교: |변동| / 전월 * 100 >= 기준% ⇔ |변동| * 100 >= 기준% * 전월
+            delta = abs(billing.final_amount - prev_amount)
+
+            if delta * 100 >= SUDDEN_CHANGE_THRESHOLD_PERCENT * prev_amount:
+                change_rate = delta / prev_amount * 100
+                yield ValidationWarning(
+                    code='AMOUNT_SUDDEN_CHANGE',
+                    level='warning',
+                    message=f'금액 급변 감지: 전월 {prev_amount:,.0f}원 → 이번달 {billing.final_amount:,.0f}원 ({change_rate:.1f}% 변동)'
+                )
 
     def _check_outsourcing_missing(
         self,
         billing: MonthlyBilling,
         contract: Contract
-    ) -> List[dict]:
+    ) -> Iterator[ValidationWarning]:
         """4. 외주금액 미입력 경고"""
-        warnings = []
-
         # 외주가 있어야 하는 계약인데 0인 경우
         has_default_outsourcing = (
             contract.default_outsourcing_company_id is not None or
@@ -166,206 +240,219 @@ class ValidationEngine:
 
         if has_default_outsourcing and billing.outsourcing_amount == 0:
             if not contract.outsourcing_amount_zero:
-                warnings.append({
-                    'code': 'OUTSOURCING_MISSING',
-                    'level': 'warning',
-                    'message': '외주금액이 0원입니다. 확인이 필요합니다.'
-                })
-
-        return warnings
+                yield ValidationWarning(
+                    code='OUTSOURCING_MISSING',
+                    level='warning',
+                    message='외주금액이 0원입니다. 확인이 필요합니다.'
+                )
 
     def _check_duplicate_risk(
         self,
         billing: MonthlyBilling,
-        contract: Contract
-    ) -> List[dict]:
+        contract: Contract,
+        related: Optional[RelatedBillings] = None
+    ) -> Iterator[ValidationWarning]:
         """5. 중복 청구 가능성"""
-        warnings = []
-
         # 동일 계약 동일 월 다른 청구 존재 여부
-        statement = select(MonthlyBilling).where(
-            MonthlyBilling.contract_id == contract.id,
-            MonthlyBilling.billing_year == billing.billing_year,
-            MonthlyBilling.billing_month == billing.billing_month,
-            MonthlyBilling.status != BillingStatus.CANCELLED.value
-        )
-
-        if billing.id:
-            statement = statement.where(MonthlyBilling.id != billing.id)
+        if related is not None:
+            existing_count = sum(
+                1 for other in related.get(
+                    (contract.id, billing.billing_year, billing.billing_month), ()
+                )
+                if other.id != billing.id
+            )
+        else:
+            # 건수만 필요하므로 청구 객체를 로드하지 않고 COUNT 조회
+            statement = select(func.count()).select_from(MonthlyBilling).where(
+                MonthlyBilling.contract_id == contract.id,
+                MonthlyBilling.billing_year == billing.billing_year,
+                MonthlyBilling.billing_month == billing.billing_month,
+                MonthlyBilling.status != BillingStatus.CANCELLED.value
+            )
 
-        existing = self.session.exec(statement).all()
+            if billing.id:
+                statement = statement.where(MonthlyBilling.id != billing.id)
 
-        if existing:
-            warnings.append({
-                'code': 'DUPLICATE_BILLING',
-                'level': 'error',
-                'message': f'동일 계약에 대해 {len(existing)}건의 다른 청구가 존재합니다'
-            })
+            existing_count = self.session.exec(statement).one()
 
-        return warnings
+        if existing_count:
+            yield ValidationWarning(
+                code='DUPLICATE_BILLING',
+                level='error',
+                message=f'동일 계약에 대해 {existing_count}건의 다른 청구가 존재합니다'
+            )
 
     def _check_reverse_billing(
         self,
         billing: MonthlyBilling,
         contract: Contract
-    ) -> List[dict]:
+    ) -> Iterator[ValidationWarning]:
         """6. 역발행 규칙 체크"""
-        warnings = []
-
         if contract.is_reverse_billing:
             # 역발행인데 발행일이 설정된 경우
             if billing.sales_date or billing.request_date:
-                warnings.append({
-                    'code': 'REVERSE_BILLING_DATE_SET',
-                    'level': 'info',
-                    'message': '역발행 계약입니다. 발행일자는 참고용입니다.'
-                })
-
-            warnings.append({
-                'code': 'REVERSE_BILLING',
-                'level': 'info',
-                'message': '역발행 계약 - 상대방 발행 기준으로 관리'
-            })
-
-        return warnings
+                yield ValidationWarning(
+                    code='REVERSE_BILLING_DATE_SET',
+                    level='info',
+                    message='역발행 계약입니다. 발행일자는 참고용입니다.'
+                )
+
+            yield ValidationWarning(
+                code='REVERSE_BILLING',
+                level='info',
+                message='역발행 계약 - 상대방 발행 기준으로 관리'
+            )
 
-    def _check_billing_rules(self, contract: Contract) -> List[dict]:
+    def _check_billing_rules(self, contract: Contract) -> Iterator[ValidationWarning]:
         """7. PO/첨부 필수 체크"""
-        warnings = []
-
         if contract.notes_parsed:
+            rules = self._get_billing_rules(contract.notes_parsed)
+
+            if rules.get('requires_po'):
+                yield ValidationWarning(
+                    code='PO_REQUIRED',
+                    level='info',
+                    message='PO번호 필수 업체입니다'
+                )
+
+            if rules.get('requires_attachment'):
+                attachment_note = rules.get('attachment_note', '')
+                yield ValidationWarning(
+                    code='ATTACHMENT_REQUIRED',
+                    level='info',
+                    message=f'첨부 필수: {attachment_note}'
+                )
+
+    def _get_billing_rules(self, raw: str) -> dict:
+        """청구 규칙 JSON 파싱 (동일 문자열은 캐시 사용, 파싱 실패 시 빈 규칙)"""
+        rules = self._rules_cache.get(raw)
+        if rules is None:
             try:
-                rules = json.loads(contract.notes_parsed)
-
-                if rules.get('requires_po'):
-                    warnings.append({
-                        'code': 'PO_REQUIRED',
-                        'level': 'info',
-                        'message': 'PO번호 필수 업체입니다'
-                    })
-
-                if rules.get('requires_attachment'):
-                    attachment_note = rules.get('attachment_note', '')
-                    warnings.append({
-                        'code': 'ATTACHMENT_REQUIRED',
-                        'level': 'info',
-                        'message': f'첨부 필수: {attachment_note}'
-                    })
-
+                rules = json.loads(raw)
             except json.JSONDecodeError:
-                pass
-
-        return warnings
+                rules = {}
+            self._rules_cache[raw] = rules
+        return rules
 
     def _check_expiring_contract(
         self,
         billing: MonthlyBilling,
-        contract: Contract
-    ) -> List[dict]:
+        contract: Contract,
+        billing_date: Optional[date] = None
+    ) -> Iterator[ValidationWarning]:
         """8. 계약 만료 임박 (1개월 이내)"""
-        warnings = []
-
         if contract.contract_end:
-            billing_date = date(billing.billing_year, billing.billing_month, 1)
+            if billing_date is None:
+                billing_date = date(billing.billing_year, billing.billing_month, 1)
             days_until_expiry = (contract.contract_end - billing_date).days
 
             if 0 < days_until_expiry <= 30:
                 if contract.auto_renewal:
-                    warnings.append({
-                        'code': 'CONTRACT_EXPIRING_AUTO_RENEWAL',
-                        'level': 'info',
-                        'message': f'계약 만료 임박 ({contract.contract_end}) - 자동갱신 예정'
-                    })
+                    yield ValidationWarning(
+                        code='CONTRACT_EXPIRING_AUTO_RENEWAL',
+                        level='info',
+                        message=f'계약 만료 임박 ({contract.contract_end}) - 자동갱신 예정'
+                    )
                 else:
-                    warnings.append({
-                        'code': 'CONTRACT_EXPIRING',
-                        'level': 'warning',
-                        'message': f'계약 만료 임박 ({contract.contract_end}) - 갱신 확인 필요'
-                    })
-
-        return warnings
+                    yield ValidationWarning(
+                        code='CONTRACT_EXPIRING',
+                        level='warning',
+                        message=f'계약 만료 임박 ({contract.contract_end}) - 갱신 확인 필요'
+                    )
 
-    def _check_previous_unconfirmed(self, billing: MonthlyBilling) -> List[dict]:
+    def _check_previous_unconfirmed(
+        self,
+        billing: MonthlyBilling,
+        related: Optional[RelatedBillings] = None
+    ) -> Iterator[ValidationWarning]:
         """9. 이전 월 미확정 청구"""
-        warnings = []
-
         # 이전 월 조회
-        prev_month = billing.billing_month - 1
-        prev_year = billing.billing_year
-        if prev_month == 0:
-            prev_month = 12
-            prev_year -= 1
-
-        statement = select(MonthlyBilling).where(
-            MonthlyBilling.contract_id == billing.contract_id,
-            MonthlyBilling.billing_year == prev_year,
-            MonthlyBilling.billing_month == prev_month,
-            MonthlyBilling.status == BillingStatus.DRAFT.value
-        )
+        prev_year, prev_month = _previous_month(billing.billing_year, billing.billing_month)
 
-        prev_drafts = self.session.exec(statement).all()
-
-        if prev_drafts:
-            warnings.append({
-                'code': 'PREVIOUS_UNCONFIRMED',
-                'level': 'warning',
-                'message': f'{prev_year}년 {prev_month}월 청구가 아직 미확정 상태입니다'
-            })
-
-        return warnings
+        if related is not None:
+            has_prev_draft = any(
+                prev.status == BillingStatus.DRAFT.value
+                for prev in related.get((billing.contract_id, prev_year, prev_month), ())
+            )
+        else:
+            # 존재 여부만 필요하므로 EXISTS 조회
+            has_prev_draft = self.session.exec(select(
+                select(MonthlyBilling.id).where(
+                    MonthlyBilling.contract_id == billing.contract_id,
+                    MonthlyBilling.billing_year == prev_year,
+                    MonthlyBilling.billing_month == prev_month,
+                    MonthlyBilling.status == BillingStatus.DRAFT.value
+                ).exists()
+            )).one()
+
+        if has_prev_draft:
+            yield ValidationWarning(
+                code='PREVIOUS_UNCONFIRMED',
+                level='warning',
+                message=f'{prev_year}년 {prev_month}월 청구가 아직 미확정 상태입니다'
+            )
 
     def _check_auto_renewal_status(
         self,
         billing: MonthlyBilling,
-        contract: Contract
-    ) -> List[dict]:
+        contract: Contract,
+        billing_date: Optional[date] = None
+    ) -> Iterator[ValidationWarning]:
         """10. 자동갱신 롤링 상태 확인"""
-        warnings = []
-
         if contract.auto_renewal and contract.contract_end:
-            check_date = date(billing.billing_year, billing.billing_month, 1)
+            if billing_date is None:
+                billing_date = date(billing.billing_year, billing.billing_month, 1)
 
             is_active, eff_start, eff_end, status_msg = calculate_contract_period_status(
                 contract.contract_start,
                 contract.contract_end,
                 contract.auto_renewal,
                 contract.renewal_period_months or 12,
-                check_date
+                billing_date
             )
 
             if '자동갱신됨' in status_msg:
-                warnings.append({
-                    'code': 'AUTO_RENEWED',
-                    'level': 'info',
-                    'message': status_msg
-                })
-
-        return warnings
+                yield ValidationWarning(
+                    code='AUTO_RENEWED',
+                    level='info',
+                    message=status_msg
+                )
 
     def get_all_warnings_for_month(
         self,
         year: int,
         month: int
     ) -> List[dict]:
-        """월별 전체 경고 조회"""
-        statement = select(MonthlyBilling).where(
+        """월별 전체 경고 조회
+
+        업체명은 계약/업체 조인으로 함께 조회 - 청구별 관계 지연 로드(N+1) 방지
+        """
+        statement = select(
+            MonthlyBilling.id,
+            MonthlyBilling.contract_id,
+            MonthlyBilling.warnings,
+            Company.name
+        ).join(
+            Contract, MonthlyBilling.contract_id == Contract.id, isouter=True
+        ).join(
+            Company, Contract.company_id == Company.id, isouter=True
+        ).where(
             MonthlyBilling.billing_year == year,
             MonthlyBilling.billing_month == month,
             MonthlyBilling.has_warnings == True
         )
 
-        billings = self.session.exec(statement).all()
         all_warnings = []
 
-        for billing in billings:
-            if billing.warnings:
+        for billing_id, contract_id, warnings_json, company_name in self.session.exec(statement):
+            if warnings_json:
                 try:
-                    warnings = json.loads(billing.warnings)
+                    warnings = json.loads(warnings_json)
                     for w in warnings:
-                        w['billing_id'] = billing.id
-                        w['contract_id'] = billing.contract_id
-                        if billing.contract and billing.contract.company:
-                            w['company_name'] = billing.contract.company.name
+                        w['billing_id'] = billing_id
+                        w['contract_id'] = contract_id
+                        if company_name is not None:
+                            w['company_name'] = company_name
                         all_warnings.append(w)
                 except json.JSONDecodeError:
                     pass
@@ -377,41 +464,47 @@ class ValidationEngine:
         year: int,
         month: int
     ) -> List[Contract]:
-        """누락 가능성 있는 계약 조회"""
-        check_date = date(year, month, 1)
+        """누락 가능성 있는 계약 조회
 
-        # 활성 계약 조회
-        statement = select(Contract).where(
-            Contract.status.in_([
-                ContractStatus.ACTIVE.value,
-                ContractStatus.PERIOD_UNDEFINED.value
-            ])
-        )
-        contracts = self.session.exec(statement).all()
+        계약기간 유효 판정(calculate_contract_period_status)을 SQL 조건으로 처리:
+        기간 미확정/계약기간 내/만료 후 자동갱신 → 유효, 그 외 제외
 
-        # 해당 월 청구가 있는 계약 ID
-        billing_statement = select(MonthlyBilling.contract_id).where(
+        청구 주기 대상월(is_billing_target_month)도 SQL 조건으로 처리하여
+        분기/반기 계약이 비대상 월에 누락으로 잡히지 않도록 한다.
+        비정기 계약은 수동 생성 대상이므로 주기와 무관하게 포함한다.
+        """
+        check_date = date(year, month, 1)
+        target_cycles = [
+            cycle for cycle, mask in BILLING_CYCLE_TARGET_MONTH_MASK_BY_VALUE.items()
+            if mask >> month & 1
+        ]
+        target_cycles.append(BillingCycle.IRREGULAR.value)
+
+        # 해당 월 청구가 없는 활성 계약 조회 (NOT EXISTS 안티 조인)
+        # 업체 정보는 화면 표시용으로 함께 로드 - N+1 방지
+        billed_exists = select(MonthlyBilling.id).where(
+            MonthlyBilling.contract_id == Contract.id,
             MonthlyBilling.billing_year == year,
             MonthlyBilling.billing_month == month,
             MonthlyBilling.status != BillingStatus.CANCELLED.value
-        )
-        billed_contract_ids = set(self.session.exec(billing_statement).all())
+        ).exists()
 
-        missing = []
-        for contract in contracts:
-            if contract.id in billed_contract_ids:
-                continue
-
-            # 계약기간 확인 (자동갱신 포함)
-            is_active, _, _, _ = calculate_contract_period_status(
-                contract.contract_start,
-                contract.contract_end,
-                contract.auto_renewal,
-                contract.renewal_period_months or 12,
-                check_date
-            )
-
-            if is_active:
-                missing.append(contract)
-
-        return missing
+        statement = select(Contract).where(
+            Contract.status.in_(BILLABLE_CONTRACT_STATUSES),
+            or_(
+                Contract.contract_start.is_(None),
+                Contract.contract_end.is_(None),
+                and_(
+                    Contract.contract_start <= check_date,
+                    Contract.contract_end >= check_date
+                ),
+                and_(
+                    Contract.contract_end < check_date,
+                    Contract.auto_renewal == True  # noqa: E712
+                )
+            ),
+            Contract.billing_cycle.in_(target_cycles),
+            ~billed_exists
+        ).options(selectinload(Contract.company))
+
+        return list(self.session.exec(statement).all())
@@ -3,6 +3,8 @@
 import pytest
 from datetime import date
 from decimal import Decimal
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, Session, create_engine
 
 from database.models import (
@@ -12,154 +14,153 @@ from database.models import (
 from utils.constants import CompanyType, BillingCycle, ContractStatus, BillingStatus
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def engine():
-    """테스트용 인메모리 데이터베이스 엔진"""
+    """테스트용 인메모리 데이터베이스 엔진 (전체 테스트 공유, 스키마 1회 생성)
+
+    StaticPool로 단일 연결을 공유하고, pysqlite의 자체 트랜잭션 처리를 끄고
+    BEGIN을 직접 발행해 SAVEPOINT가 정상 동작하도록 한다.
+    """
     engine = create_engine(
-        "sqlite:///:memory:",
+        "sqlite://",
         echo=False,
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
     )
+
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # 테스트 전용 - 저널/동기화 비용 제거 (인메모리 DB라 WAL은 적용 불가)
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     SQLModel.metadata.create_all(engine)
     return engine
 
 
 @pytest.fixture
 def session(engine):
-    """테스트용 세션"""
-    with Session(engine) as session:
+    """테스트용 세션 (테스트 종료 시 전체 롤백)
+
+    외부 트랜잭션 안에서 세션의 commit/rollback은 SAVEPOINT로 처리되므로
+    테스트마다 빈 데이터베이스 상태가 보장된다.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
         yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+# 샘플 계약 기본값 (월 청구, 자동갱신) - contract_factory에서 overrides로 덮어씀
+_CONTRACT_DEFAULTS = dict(
+    item_name="유지보수비",
+    contract_start=date(2024, 1, 1),
+    contract_end=date(2024, 12, 31),
+    monthly_amount=Decimal("1000000"),
+    billing_cycle=BillingCycle.MONTHLY.value,
+    auto_renewal=True,
+    status=ContractStatus.ACTIVE.value,
+)
+
+
+def _persist(session, obj):
+    """fixture 데이터 저장 (commit 대신 flush - 테스트 종료 시 외부 트랜잭션과 함께 롤백)"""
+    session.add(obj)
+    session.flush()
+    return obj
 
 
 @pytest.fixture
 def sample_company(session):
     """샘플 매출업체"""
-    company = Company(
+    return _persist(session, Company(
         code="C001",
         name="테스트고객",
         company_type=CompanyType.SALES.value,
         warehouse_code="105"
-    )
-    session.add(company)
-    session.commit()
-    session.refresh(company)
-    return company
+    ))
 
 
 @pytest.fixture
 def sample_outsourcing_company(session):
     """샘플 외주업체"""
-    company = Company(
+    return _persist(session, Company(
         code="V001",
         name="외주업체A",
         company_type=CompanyType.PURCHASE.value
-    )
-    session.add(company)
-    session.commit()
-    session.refresh(company)
-    return company
+    ))
+
+
+@pytest.fixture
+def contract_factory(session, sample_company):
+    """샘플 업체 계약 생성 factory (기본값 + overrides)"""
+    def make_contract(**overrides) -> Contract:
+        fields = {**_CONTRACT_DEFAULTS, 'company_id': sample_company.id, **overrides}
+        return _persist(session, Contract(**fields))
+
+    return make_contract
 
 
 @pytest.fixture
-def sample_contract(session, sample_company):
+def sample_contract(contract_factory):
     """샘플 계약 (월 청구, 자동갱신)"""
-    contract = Contract(
-        company_id=sample_company.id,
-        item_name="유지보수비",
-        contract_start=date(2024, 1, 1),
-        contract_end=date(2024, 12, 31),
-        monthly_amount=Decimal("1000000"),
-        billing_cycle=BillingCycle.MONTHLY.value,
-        billing_timing="말일",
-        auto_renewal=True,
-        renewal_period_months=12,
-        status=ContractStatus.ACTIVE.value
-    )
-    session.add(contract)
-    session.commit()
-    session.refresh(contract)
-    return contract
+    return contract_factory(billing_timing="말일", renewal_period_months=12)
 
 
 @pytest.fixture
-def sample_quarterly_contract(session, sample_company):
+def sample_quarterly_contract(contract_factory):
     """샘플 분기 청구 계약"""
-    contract = Contract(
-        company_id=sample_company.id,
+    return contract_factory(
         item_name="분기 유지보수",
-        contract_start=date(2024, 1, 1),
-        contract_end=date(2024, 12, 31),
         monthly_amount=Decimal("500000"),
         billing_cycle=BillingCycle.QUARTERLY.value,
-        billing_timing="분기말",
-        auto_renewal=True,
-        status=ContractStatus.ACTIVE.value
+        billing_timing="분기말"
     )
-    session.add(contract)
-    session.commit()
-    session.refresh(contract)
-    return contract
 
 
 @pytest.fixture
-def sample_semiannual_contract(session, sample_company):
+def sample_semiannual_contract(contract_factory):
     """샘플 반기 청구 계약"""
-    contract = Contract(
-        company_id=sample_company.id,
+    return contract_factory(
         item_name="반기 유지보수",
-        contract_start=date(2024, 1, 1),
-        contract_end=date(2024, 12, 31),
         monthly_amount=Decimal("800000"),
-        billing_cycle=BillingCycle.SEMIANNUAL.value,
-        auto_renewal=True,
-        status=ContractStatus.ACTIVE.value
+        billing_cycle=BillingCycle.SEMIANNUAL.value
     )
-    session.add(contract)
-    session.commit()
-    session.refresh(contract)
-    return contract
 
 
 @pytest.fixture
-def sample_reverse_billing_contract(session, sample_company):
+def sample_reverse_billing_contract(contract_factory):
     """샘플 역발행 계약"""
-    contract = Contract(
-        company_id=sample_company.id,
+    return contract_factory(
         item_name="역발행 유지보수",
-        contract_start=date(2024, 1, 1),
-        contract_end=date(2024, 12, 31),
         monthly_amount=Decimal("600000"),
-        billing_cycle=BillingCycle.MONTHLY.value,
         billing_timing="역발행",
-        is_reverse_billing=True,
-        auto_renewal=True,
-        status=ContractStatus.ACTIVE.value
+        is_reverse_billing=True
     )
-    session.add(contract)
-    session.commit()
-    session.refresh(contract)
-    return contract
 
 
 @pytest.fixture
-def sample_contract_with_outsourcing(session, sample_company, sample_outsourcing_company):
+def sample_contract_with_outsourcing(contract_factory, sample_outsourcing_company):
     """샘플 외주 포함 계약"""
-    contract = Contract(
-        company_id=sample_company.id,
+    return contract_factory(
         item_name="외주 포함 유지보수",
-        contract_start=date(2024, 1, 1),
-        contract_end=date(2024, 12, 31),
         monthly_amount=Decimal("2000000"),
-        billing_cycle=BillingCycle.MONTHLY.value,
-        auto_renewal=True,
         default_outsourcing_company_id=sample_outsourcing_company.id,
-        default_outsourcing_amount=Decimal("500000"),
-        status=ContractStatus.ACTIVE.value
+        default_outsourcing_amount=Decimal("500000")
     )
-    session.add(contract)
-    session.commit()
-    session.refresh(contract)
-    return contract
 
 
 @pytest.fixture
@@ -171,8 +172,7 @@ def sample_holidays(session):
         Holiday(holiday_date=date(2024, 5, 5), name="어린이날"),
         Holiday(holiday_date=date(2024, 12, 25), name="성탄절"),
     ]
-    for h in holidays:
-        session.add(h)
+    session.add_all(holidays)
     session.commit()
     return [h.holiday_date for h in holidays]
 
@@ -184,7 +184,6 @@ def sample_code_mappings(session):
         CodeMapping(code="105", name="1팀", category="warehouse"),
         CodeMapping(code="106", name="2팀", category="warehouse"),
     ]
-    for m in mappings:
-        session.add(m)
+    session.add_all(mappings)
     session.commit()
     return mappings
@@ -95,6 +95,35 @@ class TestAutoRenewal:
 
         assert len(billings) == 0
 
+    def test_contract_not_started_excluded(self, session, sample_company):
+        """계약 시작 전 계약 청구 미생성 (미확정 계약은 생성)"""
+        session.add_all([
+            Contract(
+                company_id=sample_company.id,
+                item_name="시작 전 계약",
+                contract_start=date(2024, 7, 1),
+                contract_end=date(2025, 6, 30),
+                monthly_amount=Decimal("1000000"),
+                billing_cycle=BillingCycle.MONTHLY.value,
+                auto_renewal=True,
+                status="active"
+            ),
+            Contract(
+                company_id=sample_company.id,
+                item_name="기간 미확정 계약",
+                monthly_amount=Decimal("500000"),
+                billing_cycle=BillingCycle.MONTHLY.value,
+                status="period_undefined"
+            ),
+        ])
+        session.commit()
+
+        engine = BillingEngine(session)
+        billings, _ = engine.generate_monthly_billings(2024, 6)
+
+        assert len(billings) == 1
+        assert billings[0].calculated_amount == Decimal("500000")
+
 
 class TestDuplicatePrevention:
     """중복 청구 방지 테스트"""
@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import date
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 
 from services.calculation_engine import CalculationEngine
 from database.models import Contract, MonthlyBilling, OutsourcingEntry
@@ -62,6 +62,19 @@ class TestVatCalculation:
         assert vat == Decimal("123457")  # 반올림
         assert total == Decimal("1358024")
 
+    def test_vat_rounding_matches_decimal(self, session):
+        """정수 금액 부가세가 Decimal 반올림 결과와 동일 (음수/소수 포함)"""
+        engine = CalculationEngine(session)
+
+        for amount in (Decimal("15"), Decimal("-15"), Decimal("14"), Decimal("-25"),
+                       Decimal("1234.5"), Decimal("1000000.00"), 1234565):
+            expected = (Decimal(amount) * Decimal("0.1")).quantize(
+                Decimal("1"), rounding=ROUND_HALF_UP
+            )
+            vat, total = engine.calculate_vat_and_total(amount)
+            assert vat == expected
+            assert total == amount + expected
+
 
 class TestOutsourcingAmountCalculation:
     """외주금액 계산 테스트"""
@@ -132,8 +145,7 @@ class TestOutsourcingAmountCalculation:
                 purchase_date=date(2024, 6, 20)
             ),
         ]
-        for entry in entries:
-            session.add(entry)
+        session.add_all(entries)
         session.commit()
 
         engine = CalculationEngine(session)
@@ -167,3 +179,150 @@ class TestProfitCalculation:
         )
 
         assert profit == Decimal("1000000")
+
+
+class TestMonthlySummary:
+    """월별 집계 테스트"""
+
+    def test_monthly_summary_totals(self, session, sample_contract, sample_contract_with_outsourcing):
+        """월별 합계 (원 단위 정수)"""
+        from services.billing_engine import BillingEngine
+
+        billing_engine = BillingEngine(session)
+        billings, _ = billing_engine.generate_monthly_billings(2024, 6)
+        billing_engine.save_billings(billings)
+
+        engine = CalculationEngine(session)
+        summary = engine.calculate_monthly_summary(2024, 6)
+
+        assert summary['count'] == 2
+        assert summary['total_billing'] == 3000000  # 1,000,000 + 2,000,000
+        assert summary['total_outsourcing'] == 500000
+        assert summary['total_profit'] == 2500000
+        assert isinstance(summary['total_billing'], Decimal)
+        assert summary['by_warehouse']['105']['count'] == 2
+
+        # 창고 필터
+        assert engine.calculate_monthly_summary(2024, 6, warehouse_code="106")['count'] == 0
+
+    def test_monthly_summary_excludes_cancelled(self, session, sample_contract):
+        """취소 청구 제외 및 창고 필터"""
+        from services.billing_engine import BillingEngine
+        from utils.constants import BillingStatus
+
+        billing_engine = BillingEngine(session)
+        billings, _ = billing_engine.generate_monthly_billings(2024, 6)
+        saved = billing_engine.save_billings(billings)
+        saved[0].status = BillingStatus.CANCELLED.value
+        session.commit()
+
+        engine = CalculationEngine(session)
+        summary = engine.calculate_monthly_summary(2024, 6)
+        assert summary['count'] == 0
+        assert summary['total_billing'] == 0
+
+        summary = engine.calculate_monthly_summary(2024, 6, warehouse_code="106")
+        assert summary['by_warehouse'] == {}
+
+    def test_monthly_summary_by_warehouse(self, session, sample_contract, sample_outsourcing_company):
+        """창고별 집계 (창고 코드 없는 업체는 unknown)"""
+        from database.models import Contract
+        from services.billing_engine import BillingEngine
+        from utils.constants import ContractStatus
+
+        # 창고 코드 없는 업체의 계약
+        contract = Contract(
+            company_id=sample_outsourcing_company.id,
+            item_name="창고 미지정",
+            contract_start=date(2024, 1, 1),
+            contract_end=date(2024, 12, 31),
+            monthly_amount=Decimal("300000"),
+            billing_cycle=BillingCycle.MONTHLY.value,
+            status=ContractStatus.ACTIVE.value
+        )
+        session.add(contract)
+        session.commit()
+
+        billing_engine = BillingEngine(session)
+        billings, _ = billing_engine.generate_monthly_billings(2024, 6)
+        billing_engine.save_billings(billings)
+
+        engine = CalculationEngine(session)
+        summary = engine.calculate_monthly_summary(2024, 6)
+
+        assert summary['count'] == 2
+        assert summary['total_billing'] == 1300000
+        assert summary['by_warehouse']['105'] == {
+            'billing': 1000000, 'outsourcing': 0, 'profit': 1000000, 'count': 1
+        }
+        assert summary['by_warehouse']['unknown']['billing'] == 300000
+
+
+class TestEffectiveAmountPrefetch:
+    """계약변경 이력 사전 조회 테스트"""
+
+    def _add_history(self, session, contract_id, change_type, effective_date, new_value):
+        import json
+        from database.models import ContractHistory
+
+        session.add(ContractHistory(
+            contract_id=contract_id,
+            change_type=change_type,
+            effective_date=effective_date,
+            new_value=json.dumps(new_value)
+        ))
+        session.commit()
+
+    def test_prefetch_applies_latest_history(self, session, sample_contract_with_outsourcing):
+        """적용일 기준 최신 이력 반영 (미래 이력 제외)"""
+        contract = sample_contract_with_outsourcing
+        self._add_history(session, contract.id, 'amount', date(2024, 3, 1), {'monthly_amount': 2200000})
+        self._add_history(session, contract.id, 'amount', date(2024, 5, 1), {'monthly_amount': 2500000})
+        self._add_history(session, contract.id, 'amount', date(2024, 9, 1), {'monthly_amount': 3000000})
+        self._add_history(session, contract.id, 'outsourcing', date(2024, 4, 1), {'outsourcing_amount': 600000})
+
+        engine = CalculationEngine(session)
+        engine.prefetch_effective_amounts([contract.id], date(2024, 6, 1))
+
+        amount, _, _ = engine.calculate_billing_amount(contract, 2024, 6)
+        outsourcing, _ = engine.calculate_outsourcing_amount(contract, None, 2024, 6, 1)
+
+        assert amount == Decimal("2500000")
+        assert outsourcing == Decimal("600000")
+
+        # 다른 기준월은 캐시 미사용 (개별 조회)
+        amount, _, _ = engine.calculate_billing_amount(contract, 2024, 10)
+        assert amount == Decimal("3000000")
+
+    def test_prefetch_without_history_uses_default(self, session, sample_contract):
+        """이력 없는 계약은 기본 계약금액"""
+        engine = CalculationEngine(session)
+        engine.prefetch_effective_amounts([sample_contract.id], date(2024, 6, 1))
+
+        amount, _, _ = engine.calculate_billing_amount(sample_contract, 2024, 6)
+        assert amount == Decimal("1000000")
+
+
+class TestYearlySummary:
+    """연도별 집계 테스트"""
+
+    def test_yearly_summary_by_month(self, session, sample_contract, sample_quarterly_contract):
+        """월별 집계 및 연간 합계"""
+        from services.billing_engine import BillingEngine
+
+        billing_engine = BillingEngine(session)
+        for month in (5, 6):
+            billings, _ = billing_engine.generate_monthly_billings(2024, month)
+            billing_engine.save_billings(billings)
+
+        engine = CalculationEngine(session)
+        summary = engine.calculate_yearly_summary(2024)
+
+        assert summary['by_month'][5]['total_billing'] == 1000000
+        assert summary['by_month'][6]['total_billing'] == 2500000  # 월 1,000,000 + 분기 1,500,000
+        assert summary['by_month'][6]['count'] == 2
+        assert summary['by_month'][1]['count'] == 0
+        assert len(summary['by_month']) == 12
+        assert summary['total_billing'] == 3500000
+        assert summary['count'] == 3
+        assert summary['by_month'][6] == engine.calculate_monthly_summary(2024, 6)
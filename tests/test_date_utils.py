@@ -1,5 +1,6 @@
 """날짜 유틸리티 테스트"""
 
+import calendar
 import pytest
 from datetime import date
 from utils.date_utils import (
@@ -31,6 +32,13 @@ class TestGetLastDayOfMonth:
         """평년 2월"""
         assert get_last_day_of_month(2023, 2) == date(2023, 2, 28)
 
+    def test_matches_calendar(self):
+        """폐형식 말일 계산이 calendar.monthrange와 일치 (세기/400년 윤년 포함)"""
+        for year in range(1896, 2105):
+            for month in range(1, 13):
+                expected = calendar.monthrange(year, month)[1]
+                assert get_last_day_of_month(year, month) == date(year, month, expected)
+
 
 class TestAddMonths:
     """월 더하기 테스트"""
@@ -55,6 +63,11 @@ class TestAddMonths:
         result = add_months(date(2024, 2, 29), 12)
         assert result == date(2025, 2, 28)  # 평년이므로 28일
 
+    def test_add_months_negative(self):
+        """음수 개월 (연도 역변경 + 말일 보정)"""
+        assert add_months(date(2024, 3, 31), -1) == date(2024, 2, 29)
+        assert add_months(date(2024, 1, 15), -13) == date(2022, 12, 15)
+
 
 class TestIsBillingTargetMonth:
     """청구 대상 월 확인 테스트"""
@@ -86,6 +99,13 @@ class TestIsBillingTargetMonth:
         assert is_billing_target_month(BillingCycle.IRREGULAR, 2024, 8, custom) is True
         assert is_billing_target_month(BillingCycle.IRREGULAR, 2024, 6, custom) is False
 
+    def test_string_cycle_value(self):
+        """DB 저장 문자열 값으로 판정"""
+        assert is_billing_target_month("quarterly", 2024, 6) is True
+        assert is_billing_target_month("quarterly", 2024, 5) is False
+        assert is_billing_target_month("irregular", 2024, 2, [2, 8]) is True
+        assert is_billing_target_month("irregular", 2024, 2) is False
+
 
 class TestCalculateContractPeriodStatus:
     """계약기간 상태 계산 테스트 (자동갱신 포함)"""
@@ -128,6 +148,22 @@ class TestCalculateContractPeriodStatus:
         assert eff_start == date(2024, 1, 1)
         assert eff_end == date(2024, 12, 31)
 
+    def test_auto_renewal_long_gap(self):
+        """장기 경과 자동갱신 - 갱신 횟수 직접 계산 (경계일 포함)"""
+        _, eff_start, eff_end, _ = calculate_contract_period_status(
+            date(2020, 3, 15), date(2020, 9, 14),
+            auto_renewal=True, renewal_period_months=6,
+            check_date=date(2025, 9, 14)
+        )
+        assert (eff_start, eff_end) == (date(2025, 3, 15), date(2025, 9, 14))
+
+        _, eff_start, eff_end, _ = calculate_contract_period_status(
+            date(2020, 3, 15), date(2020, 9, 14),
+            auto_renewal=True, renewal_period_months=6,
+            check_date=date(2025, 9, 15)
+        )
+        assert (eff_start, eff_end) == (date(2025, 9, 15), date(2026, 3, 14))
+
     def test_period_undefined(self):
         """계약기간 미확정"""
         is_active, _, _, msg = calculate_contract_period_status(
@@ -167,6 +203,12 @@ class TestGetPreviousBusinessDay:
         result = get_previous_business_day(date(2024, 1, 1), holidays)  # 월요일 휴일
         assert result == date(2023, 12, 29)  # 금요일
 
+    def test_weekend_then_holiday_friday(self):
+        """일요일 → 금요일 휴일 → 목요일 (frozenset 휴일)"""
+        holidays = frozenset([date(2024, 5, 3)])
+        result = get_previous_business_day(date(2024, 5, 5), holidays)  # 일요일
+        assert result == date(2024, 5, 2)  # 목요일
+
 
 class TestParseBillingTiming:
     """발행시기 파싱 테스트"""
@@ -174,34 +216,44 @@ class TestParseBillingTiming:
     def test_parse_last_day(self):
         """말일 파싱"""
         result = parse_billing_timing("말일")
-        assert result['parsed'] is True
-        assert result['day'] == 'last'
+        assert result.parsed is True
+        assert result.day == 'last'
 
     def test_parse_specific_day(self):
         """특정일 파싱"""
         result = parse_billing_timing("매월 10일")
-        assert result['parsed'] is True
-        assert result['day'] == 10
+        assert result.parsed is True
+        assert result.day == 10
 
     def test_parse_reverse_billing(self):
         """역발행 파싱"""
         result = parse_billing_timing("역발행")
-        assert result['parsed'] is True
-        assert result['is_reverse_billing'] is True
+        assert result.parsed is True
+        assert result.is_reverse_billing is True
 
     def test_parse_quarterly_months(self):
         """분기월 파싱"""
         result = parse_billing_timing("3,6,9,12월 말일")
-        assert result['parsed'] is True
-        assert result['months'] == [3, 6, 9, 12]
+        assert result.parsed is True
+        assert result.months == (3, 6, 9, 12)
 
     def test_parse_requires_manual(self):
         """수동 지정 필요"""
         result = parse_billing_timing("상무님 요청시")
-        assert result['requires_manual'] is True
+        assert result.requires_manual is True
 
     def test_parse_biannual(self):
         """연 2회 파싱"""
         result = parse_billing_timing("연 2회(6월,12월)")
-        assert result['parsed'] is True
-        assert result['months'] == [6, 12]
+        assert result.parsed is True
+        assert result.months == (6, 12)
+
+    def test_parse_result_cached_and_immutable(self):
+        """동일 원문은 같은 불변 결과 공유, JSON 저장용 dict 변환 가능"""
+        first = parse_billing_timing("3,6,9,12월 말일")
+        assert parse_billing_timing("3,6,9,12월 말일") is first
+
+        with pytest.raises(AttributeError):
+            first.parsed = False
+
+        assert first._asdict()['months'] == (3, 6, 9, 12)
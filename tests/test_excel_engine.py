@@ -1,12 +1,9 @@
 """엑셀 엔진 테스트"""
 
-import pytest
 from datetime import date
 from decimal import Decimal
-from pathlib import Path
-import tempfile
-import shutil
-import gc
+from io import BytesIO
+from openpyxl import Workbook, load_workbook
 
 from services.excel_engine import ExcelEngine
 from services.billing_engine import BillingEngine
@@ -14,19 +11,10 @@ from database.models import MonthlyBilling
 from utils.constants import BillingStatus
 
 
-@pytest.fixture
-def tmpdir():
-    """Windows 호환 임시 디렉토리 (정리 에러 무시)"""
-    d = tempfile.mkdtemp()
-    yield d
-    gc.collect()  # openpyxl 파일 핸들 정리
-    shutil.rmtree(d, ignore_errors=True)
-
-
 class TestExcelExport:
     """엑셀 Export 테스트"""
 
-    def test_export_monthly_billing(self, session, sample_contract, tmpdir):
+    def test_export_monthly_billing(self, session, sample_contract):
         """월별 청구 엑셀 Export"""
         # 청구 생성
         billing_engine = BillingEngine(session)
@@ -36,14 +24,14 @@ class TestExcelExport:
         # Export
         excel_engine = ExcelEngine(session)
 
-        file_path = Path(tmpdir) / "test_export.xlsx"
-        result_path = excel_engine.export_monthly_billing(2024, 6, str(file_path))
+        buffer = BytesIO()
+        result = excel_engine.export_monthly_billing(2024, 6, buffer)
 
-        assert Path(result_path).exists()
+        assert result is buffer
 
         # 파일 검증
-        from openpyxl import load_workbook
-        wb = load_workbook(result_path)
+        buffer.seek(0)
+        wb = load_workbook(buffer)
         ws = wb.active
 
         # 헤더 확인
@@ -56,7 +44,7 @@ class TestExcelExport:
 
         wb.close()
 
-    def test_export_includes_totals(self, session, sample_contract, sample_quarterly_contract, tmpdir):
+    def test_export_includes_totals(self, session, sample_contract, sample_quarterly_contract):
         """Export에 합계 포함"""
         billing_engine = BillingEngine(session)
 
@@ -67,30 +55,31 @@ class TestExcelExport:
         # 분기 청구는 6월이 대상이므로 포함됨
         excel_engine = ExcelEngine(session)
 
-        file_path = Path(tmpdir) / "test_totals.xlsx"
-        excel_engine.export_monthly_billing(2024, 6, str(file_path))
+        buffer = BytesIO()
+        excel_engine.export_monthly_billing(2024, 6, buffer)
 
-        from openpyxl import load_workbook
-        wb = load_workbook(file_path)
+        buffer.seek(0)
+        wb = load_workbook(buffer)
         ws = wb.active
 
         # 합계 행 찾기
         last_row = ws.max_row
         assert ws.cell(row=last_row, column=3).value == "합계"
+        # 청구금액 합계: 월 1,000,000 + 분기 500,000 × 3
+        assert ws.cell(row=last_row, column=8).value == 2500000
+        assert ws.cell(row=last_row, column=13).value == 2500000
 
         wb.close()
 
-    def test_create_template(self, session, tmpdir):
+    def test_create_template(self, session):
         """빈 템플릿 생성"""
         excel_engine = ExcelEngine(session)
 
-        file_path = Path(tmpdir) / "template.xlsx"
-        result_path = excel_engine.create_template(str(file_path))
+        buffer = BytesIO()
+        excel_engine.create_template(buffer)
 
-        assert Path(result_path).exists()
-
-        from openpyxl import load_workbook
-        wb = load_workbook(result_path)
+        buffer.seek(0)
+        wb = load_workbook(buffer)
         ws = wb.active
 
         # 헤더만 존재
@@ -99,18 +88,28 @@ class TestExcelExport:
 
         wb.close()
 
+    def test_create_template_to_path(self, session, tmp_path):
+        """경로 지정 시 상위 폴더 생성 후 저장"""
+        excel_engine = ExcelEngine(session)
+
+        file_path = tmp_path / "exports" / "template.xlsx"
+        excel_engine.create_template(str(file_path))
+
+        wb = load_workbook(file_path, read_only=True)
+        assert wb.active.cell(row=1, column=1).value == "창고"
+        wb.close()
+
 
 class TestExcelImport:
     """엑셀 Import 테스트"""
 
-    def test_import_from_excel(self, session, tmpdir):
+    def test_import_from_excel(self, session):
         """엑셀 Import"""
         excel_engine = ExcelEngine(session)
 
-        # 테스트 파일 생성
-        file_path = Path(tmpdir) / "test_import.xlsx"
+        # 테스트 파일 생성 (메모리)
+        buffer = BytesIO()
 
-        from openpyxl import Workbook
         wb = Workbook()
         ws = wb.active
         ws.title = "매월 유지보수"
@@ -129,23 +128,25 @@ class TestExcelImport:
         for col, value in enumerate(data, 1):
             ws.cell(row=2, column=col, value=value)
 
-        wb.save(file_path)
+        wb.save(buffer)
         wb.close()
 
         # Import
-        records, errors = excel_engine.import_from_excel(str(file_path))
+        records, errors = excel_engine.import_from_excel(buffer)
 
         assert len(records) == 1
         assert records[0]['parsed_data']['company_name'] == '테스트업체'
         assert records[0]['parsed_data']['monthly_amount'] == Decimal("1000000")
+        # 빈 셀은 'None'이 아닌 빈 문자열
+        assert records[0]['parsed_data']['notes'] == ''
+        assert records[0]['parsed_data']['outsourcing_company'] == ''
 
-    def test_import_stops_at_total_row(self, session, tmpdir):
+    def test_import_stops_at_total_row(self, session):
         """합계 행에서 Import 중단"""
         excel_engine = ExcelEngine(session)
 
-        file_path = Path(tmpdir) / "test_total.xlsx"
+        buffer = BytesIO()
 
-        from openpyxl import Workbook
         wb = Workbook()
         ws = wb.active
 
@@ -167,19 +168,86 @@ class TestExcelImport:
         # 합계 아래 메모 (무시되어야 함)
         ws.cell(row=5, column=3, value='메모: 참고사항')
 
-        wb.save(file_path)
+        wb.save(buffer)
         wb.close()
 
-        records, _ = excel_engine.import_from_excel(str(file_path))
+        records, _ = excel_engine.import_from_excel(buffer)
 
         # 합계 전까지만 Import
         assert len(records) == 2
 
+    def test_save_imported_data(self, session, sample_contract):
+        """Import 저장 - 기존 계약 업데이트, 신규 업체/계약 생성 (동일 업체 재사용)"""
+        excel_engine = ExcelEngine(session)
+
+        buffer = BytesIO()
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(excel_engine.TEMPLATE_HEADERS)
+        ws.append(['105', 'C001', '테스트고객', '유지보수비', '2024-01-01', '2024-12-31',
+                   1500000, 1500000, 150000, 1650000, '', 0, 1500000, '말일'])
+        ws.append(['106', 'C900', '신규업체', '유지보수A', '2024-01-01', '2024-12-31',
+                   300000, 300000, 30000, 330000, '', 0, 300000, '말일'])
+        ws.append(['106', 'C900', '신규업체', '유지보수B', '2024-01-01', '2024-12-31',
+                   200000, 200000, 20000, 220000, '', 0, 200000, '말일'])
+        wb.save(buffer)
+        wb.close()
+
+        records, _ = excel_engine.import_from_excel(buffer)
+        excel_engine.IMPORT_BATCH_SIZE = 2  # 배치 경계를 넘는 업체 재사용 확인
+        created, updated, errors = excel_engine.save_imported_data(records, update_existing=True)
+
+        assert (created, updated, errors) == (2, 1, [])
+
+        session.refresh(sample_contract)
+        assert sample_contract.monthly_amount == Decimal("1500000")
+
+        from sqlmodel import select
+        from database.models import Company
+        new_companies = session.exec(select(Company).where(Company.code == 'C900')).all()
+        assert len(new_companies) == 1
+        assert len(new_companies[0].contracts) == 2
+
+        # 동일 파일 재Import - 변경 없음
+        records, _ = excel_engine.import_from_excel(buffer)
+        assert excel_engine.save_imported_data(records, update_existing=True) == (0, 0, [])
+
+
+    def test_save_imported_duplicate_key_in_batch(self, session):
+        """같은 배치 내 중복 (업체코드, 품목명) - 신규 계약에 후행 행 값 반영, 배치 유지"""
+        excel_engine = ExcelEngine(session)
+
+        buffer = BytesIO()
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(excel_engine.TEMPLATE_HEADERS)
+        ws.append(['106', 'C900', '신규업체', '유지A', '2024-01-01', '2024-12-31',
+                   300000, 300000, 30000, 330000, '', 0, 300000, '말일'])
+        ws.append(['106', 'C900', '신규업체', '유지A', '2024-01-01', '2024-12-31',
+                   400000, 400000, 40000, 440000, '', 0, 400000, '말일'])
+        ws.append(['106', 'C900', '신규업체', '유지B', '2024-01-01', '2024-12-31',
+                   200000, 200000, 20000, 220000, '', 0, 200000, '말일'])
+        wb.save(buffer)
+        wb.close()
+
+        buffer.seek(0)
+        records, _ = excel_engine.import_from_excel(buffer)
+        created, updated, errors = excel_engine.save_imported_data(records, update_existing=True)
+
+        assert (created, updated, errors) == (2, 1, [])
+
+        from sqlmodel import select
+        from database.models import Contract
+        contract = session.exec(select(Contract).where(Contract.item_name == '유지A')).one()
+        assert contract.monthly_amount == Decimal("400000")
+
 
 class TestExcelRoundTrip:
     """엑셀 Export/Import 왕복 테스트"""
 
-    def test_export_import_roundtrip(self, session, sample_contract, tmpdir):
+    def test_export_import_roundtrip(self, session, sample_contract):
         """Export 후 Import 데이터 일치"""
         # 청구 생성 및 저장
         billing_engine = BillingEngine(session)
@@ -188,13 +256,14 @@ class TestExcelRoundTrip:
 
         excel_engine = ExcelEngine(session)
 
-        file_path = Path(tmpdir) / "roundtrip.xlsx"
+        buffer = BytesIO()
 
         # Export
-        excel_engine.export_monthly_billing(2024, 6, str(file_path))
+        excel_engine.export_monthly_billing(2024, 6, buffer)
 
         # Import
-        records, errors = excel_engine.import_from_excel(str(file_path))
+        buffer.seek(0)
+        records, errors = excel_engine.import_from_excel(buffer)
 
         # 데이터 검증
         assert len(records) == 1
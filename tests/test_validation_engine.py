@@ -5,7 +5,7 @@ from datetime import date
 from decimal import Decimal
 import json
 
-from services.validation_engine import ValidationEngine
+from services.validation_engine import ValidationEngine, group_warnings_by_code
 from services.billing_engine import BillingEngine
 from database.models import Contract, MonthlyBilling, ContractHistory
 from utils.constants import BillingCycle, BillingStatus, ContractStatus
@@ -40,7 +40,7 @@ class TestPeriodValidation:
         engine = ValidationEngine(session)
         warnings = engine.validate_billing(billing, contract)
 
-        period_warnings = [w for w in warnings if w['code'] in ['PERIOD_UNDEFINED', 'STATUS_PERIOD_UNDEFINED']]
+        period_warnings = [w for w in warnings if w.code in ['PERIOD_UNDEFINED', 'STATUS_PERIOD_UNDEFINED']]
         assert len(period_warnings) >= 1
 
 
@@ -72,10 +72,9 @@ class TestBillingTimingValidation:
         )
 
         engine = ValidationEngine(session)
-        warnings = engine.validate_billing(billing, contract)
+        warnings = group_warnings_by_code(engine.validate_billing(billing, contract))
 
-        timing_warnings = [w for w in warnings if w['code'] == 'TIMING_MANUAL_REQUIRED']
-        assert len(timing_warnings) == 1
+        assert len(warnings['TIMING_MANUAL_REQUIRED']) == 1
 
 
 class TestSuddenChangeDetection:
@@ -106,10 +105,65 @@ class TestSuddenChangeDetection:
         )
 
         engine = ValidationEngine(session)
-        warnings = engine.validate_billing(curr_billing, sample_contract)
+        warnings = group_warnings_by_code(engine.validate_billing(curr_billing, sample_contract))
+
+        assert len(warnings['AMOUNT_SUDDEN_CHANGE']) == 1
+
+    def test_sudden_change_threshold_boundary(self, session, sample_contract):
+        """기준(30%) 정확히 도달 시 경고, 미만이면 경고 없음 (감소 포함)"""
+        session.add(MonthlyBilling(
+            contract_id=sample_contract.id,
+            billing_year=2024,
+            billing_month=5,
+            calculated_amount=Decimal("1000000"),
+            final_amount=Decimal("1000000"),
+            status=BillingStatus.CONFIRMED.value
+        ))
+        session.commit()
+
+        engine = ValidationEngine(session)
+        for amount, expected in (("1300000", 1), ("1299999", 0), ("700000", 1), ("700001", 0)):
+            billing = MonthlyBilling(
+                contract_id=sample_contract.id,
+                billing_year=2024,
+                billing_month=6,
+                calculated_amount=Decimal(amount),
+                final_amount=Decimal(amount)
+            )
+            warnings = engine.validate_billing(billing, sample_contract)
+            change_warnings = [w for w in warnings if w.code == 'AMOUNT_SUDDEN_CHANGE']
+            assert len(change_warnings) == expected, amount
+
+    def test_bulk_validation_matches_single(self, session, sample_contract):
+        """일괄 검증 결과가 개별 검증과 동일"""
+        session.add(MonthlyBilling(
+            contract_id=sample_contract.id,
+            billing_year=2023,
+            billing_month=12,
+            calculated_amount=Decimal("1000000"),
+            final_amount=Decimal("1000000"),
+            status=BillingStatus.DRAFT.value
+        ))
+        session.commit()
+
+        # 연도 경계(1월 → 전년 12월) 포함
+        curr_billing = MonthlyBilling(
+            contract_id=sample_contract.id,
+            billing_year=2024,
+            billing_month=1,
+            calculated_amount=Decimal("2000000"),
+            final_amount=Decimal("2000000"),
+            status=BillingStatus.DRAFT.value
+        )
+
+        engine = ValidationEngine(session)
+        single = engine.validate_billing(curr_billing, sample_contract)
+        bulk = engine.validate_billings_bulk([(curr_billing, sample_contract)])
 
-        change_warnings = [w for w in warnings if w['code'] == 'AMOUNT_SUDDEN_CHANGE']
-        assert len(change_warnings) == 1
+        assert bulk == [single]
+        grouped = group_warnings_by_code(single)
+        assert 'AMOUNT_SUDDEN_CHANGE' in grouped
+        assert 'PREVIOUS_UNCONFIRMED' in grouped
 
 
 class TestDuplicateValidation:
@@ -140,10 +194,9 @@ class TestDuplicateValidation:
         )
 
         engine = ValidationEngine(session)
-        warnings = engine.validate_billing(new_billing, sample_contract)
+        warnings = group_warnings_by_code(engine.validate_billing(new_billing, sample_contract))
 
-        duplicate_warnings = [w for w in warnings if w['code'] == 'DUPLICATE_BILLING']
-        assert len(duplicate_warnings) == 1
+        assert len(warnings['DUPLICATE_BILLING']) == 1
 
 
 class TestReverseBillingValidation:
@@ -161,10 +214,97 @@ class TestReverseBillingValidation:
         )
 
         engine = ValidationEngine(session)
-        warnings = engine.validate_billing(billing, sample_reverse_billing_contract)
+        warnings = group_warnings_by_code(
+            engine.validate_billing(billing, sample_reverse_billing_contract)
+        )
+
+        assert len(warnings['REVERSE_BILLING']) == 1
+
+
+class TestInactiveContractValidation:
+    """청구 불가 상태 계약 검증 테스트"""
+
+    def test_terminated_contract_skips_lookup_rules(self, session, sample_contract):
+        """해지 계약은 전월/중복 조회 규칙 생략, 계약 자체 규칙은 유지"""
+        session.add(MonthlyBilling(
+            contract_id=sample_contract.id,
+            billing_year=2024,
+            billing_month=5,
+            calculated_amount=Decimal("100000"),
+            final_amount=Decimal("100000"),
+            status=BillingStatus.DRAFT.value
+        ))
+        session.commit()
 
-        reverse_warnings = [w for w in warnings if w['code'] == 'REVERSE_BILLING']
-        assert len(reverse_warnings) == 1
+        sample_contract.status = ContractStatus.TERMINATED.value
+        sample_contract.contract_end = None
+        billing = MonthlyBilling(
+            contract_id=sample_contract.id,
+            billing_year=2024,
+            billing_month=6,
+            calculated_amount=Decimal("1000000"),
+            final_amount=Decimal("1000000")
+        )
+
+        engine = ValidationEngine(session)
+        codes = {w.code for w in engine.validate_billing(billing, sample_contract)}
+        bulk_codes = {w.code for w in engine.validate_billings_bulk([(billing, sample_contract)])[0]}
+
+        assert codes == bulk_codes
+        assert 'PERIOD_UNDEFINED' in codes
+        assert not codes & {'AMOUNT_SUDDEN_CHANGE', 'PREVIOUS_UNCONFIRMED', 'DUPLICATE_BILLING'}
+
+
+class TestBillingRulesValidation:
+    """PO/첨부 규칙 검증 테스트"""
+
+    def test_billing_rules_warning(self, session, sample_contract):
+        """PO/첨부 필수 안내 (잘못된 JSON은 무시)"""
+        billing = MonthlyBilling(
+            contract_id=sample_contract.id,
+            billing_year=2024,
+            billing_month=6,
+            calculated_amount=Decimal("1000000"),
+            final_amount=Decimal("1000000")
+        )
+        engine = ValidationEngine(session)
+
+        sample_contract.notes_parsed = json.dumps(
+            {'requires_po': True, 'requires_attachment': True, 'attachment_note': '작업확인서'}
+        )
+        codes = [w.code for w in engine.validate_billing(billing, sample_contract)]
+        assert 'PO_REQUIRED' in codes
+        assert 'ATTACHMENT_REQUIRED' in codes
+
+        sample_contract.notes_parsed = '{invalid'
+        codes = [w.code for w in engine.validate_billing(billing, sample_contract)]
+        assert 'PO_REQUIRED' not in codes
+
+
+class TestMonthlyWarnings:
+    """월별 경고 조회 테스트"""
+
+    def test_warnings_include_company_name(self, session, sample_contract):
+        """저장된 경고에 청구/계약 ID와 업체명 포함"""
+        billing = MonthlyBilling(
+            contract_id=sample_contract.id,
+            billing_year=2024,
+            billing_month=6,
+            calculated_amount=Decimal("1000000"),
+            final_amount=Decimal("1000000"),
+            has_warnings=True,
+            warnings=json.dumps([{'code': 'TEST', 'level': 'warning', 'message': '테스트'}])
+        )
+        session.add(billing)
+        session.commit()
+
+        engine = ValidationEngine(session)
+        warnings = engine.get_all_warnings_for_month(2024, 6)
+
+        assert len(warnings) == 1
+        assert warnings[0]['billing_id'] == billing.id
+        assert warnings[0]['contract_id'] == sample_contract.id
+        assert warnings[0]['company_name'] == "테스트고객"
 
 
 class TestMissingBillings:
@@ -179,6 +319,61 @@ class TestMissingBillings:
         assert len(missing) == 1
         assert missing[0].id == sample_contract.id
 
+    def test_missing_billings_period_filter(self, session, sample_company, sample_contract):
+        """계약 시작 전/만료(자동갱신 없음) 제외, 만료 후 자동갱신 포함"""
+        session.add_all([
+            Contract(
+                company_id=sample_company.id,
+                item_name="만료 계약",
+                contract_start=date(2023, 1, 1),
+                contract_end=date(2023, 12, 31),
+                monthly_amount=Decimal("1000000"),
+                billing_cycle=BillingCycle.MONTHLY.value,
+                auto_renewal=False,
+                status=ContractStatus.ACTIVE.value
+            ),
+            Contract(
+                company_id=sample_company.id,
+                item_name="시작 전 계약",
+                contract_start=date(2025, 7, 1),
+                contract_end=date(2026, 6, 30),
+                monthly_amount=Decimal("1000000"),
+                billing_cycle=BillingCycle.MONTHLY.value,
+                status=ContractStatus.ACTIVE.value
+            ),
+        ])
+        session.commit()
+
+        engine = ValidationEngine(session)
+        missing = engine.get_missing_billings(2025, 3)
+
+        # 자동갱신 계약만 (2024-12-31 만료 후 롤링)
+        assert [c.id for c in missing] == [sample_contract.id]
+
+    def test_missing_billings_cycle_filter(
+        self, session, sample_contract, sample_quarterly_contract
+    ):
+        """청구 주기 비대상 월의 분기 계약은 누락에서 제외"""
+        engine = ValidationEngine(session)
+
+        # 5월: 월 청구만 대상
+        assert [c.id for c in engine.get_missing_billings(2024, 5)] == [sample_contract.id]
+
+        # 6월: 분기 청구도 대상
+        missing_ids = {c.id for c in engine.get_missing_billings(2024, 6)}
+        assert missing_ids == {sample_contract.id, sample_quarterly_contract.id}
+
+    def test_missing_billings_loads_company(self, session, sample_contract):
+        """누락 계약 조회 시 업체 정보 함께 로드 (지연 로딩 없음)"""
+        session.expire_all()
+
+        engine = ValidationEngine(session)
+        missing = engine.get_missing_billings(2024, 6)
+
+        # 세션 분리 후에도 업체 접근 가능해야 함
+        session.expunge_all()
+        assert missing[0].company.name == "테스트고객"
+
     def test_no_missing_after_billing(self, session, sample_contract):
         """청구 생성 후 누락 없음"""
         # 청구 생성
@@ -209,7 +404,6 @@ class TestOutsourcingValidation:
         )
 
         engine = ValidationEngine(session)
-        warnings = engine.validate_billing(billing, sample_contract_with_outsourcing)
+        warnings = group_warnings_by_code(engine.validate_billing(billing, sample_contract_with_outsourcing))
 
-        outsourcing_warnings = [w for w in warnings if w['code'] == 'OUTSOURCING_MISSING']
-        assert len(outsourcing_warnings) == 1
+        assert len(warnings['OUTSOURCING_MISSING']) == 1
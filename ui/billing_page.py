@@ -11,6 +11,7 @@ from database.models import MonthlyBilling, Contract, Company
 from services.billing_engine import BillingEngine
 from services.validation_engine import ValidationEngine
 from utils.constants import BillingStatus
+from ui.sidebar import get_sidebar_counts
 from ui.styles.components import (
     status_badge, status_label, alert_badge,
     warning_list_item, render_status_badge
@@ -98,6 +99,7 @@ def render_billing_generator():
                 if billings:
                     # 저장
                     saved = billing_engine.save_billings(billings)
+                    get_sidebar_counts.clear()
                     st.success(f"{len(saved)}건의 청구가 생성되었습니다.")
 
                     # 경고 표시
@@ -244,6 +246,7 @@ def render_billing_list():
                             sales_date=new_sales_date,
                             request_date=new_request_date
                         )
+                        get_sidebar_counts.clear()
                         st.success("수정되었습니다.")
                         st.rerun()
 
@@ -324,6 +327,7 @@ def render_billing_confirmation():
             if st.button("일괄 확정", type="primary"):
                 for billing in drafts:
                     billing_engine.confirm_billing(billing.id)
+                get_sidebar_counts.clear()
                 st.success(f"{len(drafts)}건이 확정되었습니다.")
                 st.rerun()
         else:
@@ -341,6 +345,7 @@ def render_billing_confirmation():
             if st.button("일괄 잠금", type="secondary"):
                 for billing in confirmed:
                     billing_engine.lock_billing(billing.id)
+                get_sidebar_counts.clear()
                 st.success(f"{len(confirmed)}건이 잠금되었습니다.")
                 st.rerun()
         else:
@@ -11,6 +11,8 @@ from database.models import Contract, Company, ContractHistory, CodeMapping
 from utils.constants import BillingCycle, ContractStatus
 from utils.date_utils import parse_billing_timing
 from utils.parsing_utils import parse_notes_for_rules
+from utils.json_utils import dumps_json
+from ui.sidebar import get_sidebar_counts
 
 
 def render_contract_page():
@@ -230,7 +232,7 @@ def render_contract_form():
 
                 # 역발행 체크 (발행시기 또는 체크박스)
                 is_reverse = is_reverse_billing
-                if timing_parsed and timing_parsed.get('is_reverse_billing'):
+                if timing_parsed and timing_parsed.is_reverse_billing:
                     is_reverse = True
 
                 # 상태 결정
@@ -247,7 +249,7 @@ def render_contract_form():
                     monthly_amount=Decimal(str(monthly_amount)),
                     billing_cycle=billing_cycle[1],
                     billing_timing=billing_timing,
-                    billing_timing_parsed=json.dumps(timing_parsed, ensure_ascii=False) if timing_parsed else None,
+                    billing_timing_parsed=dumps_json(timing_parsed._asdict()) if timing_parsed else None,
                     auto_renewal=auto_renewal,
                     renewal_period_months=renewal_period,
                     is_reverse_billing=is_reverse,
@@ -256,11 +258,12 @@ def render_contract_form():
                     outsourcing_amount_zero=outsourcing_zero,
                     status=status,
                     notes=notes,
-                    notes_parsed=json.dumps(notes_parsed, ensure_ascii=False) if notes_parsed else None
+                    notes_parsed=dumps_json(notes_parsed) if notes_parsed else None
                 )
 
                 session.add(contract)
                 session.commit()
+                get_sidebar_counts.clear()
 
                 st.success("계약이 등록되었습니다.")
                 st.rerun()
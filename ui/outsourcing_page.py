@@ -4,6 +4,7 @@ import streamlit as st
 from datetime import date
 from decimal import Decimal
 from sqlmodel import select
+from sqlalchemy.orm import defer
 
 from database.connection import get_session
 from database.models import (
@@ -111,7 +112,7 @@ def render_outsourcing_entry():
             select(MonthlyBilling).where(
                 MonthlyBilling.billing_year == entry_year,
                 MonthlyBilling.billing_month == entry_month
-            )
+            ).options(defer(MonthlyBilling.warnings), defer(MonthlyBilling.notes))
         ).all()
 
         if not billings:
@@ -4,6 +4,7 @@ import streamlit as st
 from datetime import date
 from decimal import Decimal
 from sqlmodel import select
+from sqlalchemy.orm import defer
 import pandas as pd
 
 from database.connection import get_session
@@ -198,7 +199,7 @@ def render_excel_export():
             select(MonthlyBilling).where(
                 MonthlyBilling.billing_year == export_year,
                 MonthlyBilling.billing_month == export_month
-            )
+            ).options(defer(MonthlyBilling.warnings), defer(MonthlyBilling.notes))
         ).all()
 
         st.write(f"Export 대상: {len(billings)}건")
@@ -2,12 +2,14 @@
 
 import streamlit as st
 from datetime import date
+from io import BytesIO
 from sqlmodel import select
 
 from database.connection import get_session
 from database.models import CodeMapping, Holiday, Company
 from services.excel_engine import ExcelEngine
 from utils.constants import CompanyType
+from ui.sidebar import get_sidebar_counts
 
 
 def render_settings_page():
@@ -248,21 +250,14 @@ def render_data_import():
     )
 
     if uploaded_file is not None:
-        # 임시 파일로 저장
-        from pathlib import Path
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp:
-            tmp.write(uploaded_file.getvalue())
-            tmp_path = tmp.name
-
+        # 업로드 파일은 임시 파일 없이 메모리(BytesIO)에서 바로 읽는다
         with get_session() as session:
             excel_engine = ExcelEngine(session)
 
             # 미리보기
             if st.button("데이터 미리보기"):
                 try:
-                    records, errors = excel_engine.import_from_excel(tmp_path)
+                    records, errors = excel_engine.import_from_excel(BytesIO(uploaded_file.getvalue()))
 
                     st.write(f"총 {len(records)}건 발견")
 
@@ -295,10 +290,11 @@ def render_data_import():
 
             if st.button("Import 실행", type="primary"):
                 try:
-                    records, errors = excel_engine.import_from_excel(tmp_path)
+                    records, errors = excel_engine.import_from_excel(BytesIO(uploaded_file.getvalue()))
                     created, updated, save_errors = excel_engine.save_imported_data(
                         records, update_existing
                     )
+                    get_sidebar_counts.clear()
 
                     st.success(
                         f"Import 완료:\n"
@@ -313,6 +309,3 @@ def render_data_import():
 
                 except Exception as e:
                     st.error(f"Import 실패: {str(e)}")
-
-        # 임시 파일 삭제
-        Path(tmp_path).unlink(missing_ok=True)
@@ -0,0 +1,59 @@
+"""사이드바 현황 요약 (캐시)"""
+
+from typing import Tuple
+
+import streamlit as st
+from sqlmodel import select, func, case
+
+from database.connection import get_session
+from database.models import MonthlyBilling, Contract
+from utils.constants import BillingStatus, BILLABLE_CONTRACT_STATUSES
+
+
+@st.cache_data(ttl=60)
+def get_sidebar_counts(year: int, month: int) -> Tuple[int, int, int]:
+    """사이드바 현황 집계 (활성 계약 수, 해당 월 청구 수, 미확정 청구 수)
+
+    Streamlit은 위젯 조작마다 전체 스크립트를 재실행하므로 (year, month) 기준으로
+    결과를 캐시한다. 캐시 가능한 원시값만 반환하며, 청구/계약 변경 시
+    `get_sidebar_counts.clear()`로 무효화한다.
+    """
+    with get_session() as session:
+        # 활성 계약 수
+        active_contracts = session.exec(
+            select(func.count()).select_from(Contract).where(
+                Contract.status.in_(BILLABLE_CONTRACT_STATUSES)
+            )
+        ).one()
+
+        # 해당 월 청구 수 / 초안 상태 청구 수 (단일 집계 쿼리)
+        monthly_billings, draft_billings = session.exec(
+            select(
+                func.count(),
+                func.coalesce(func.sum(case(
+                    (MonthlyBilling.status == BillingStatus.DRAFT.value, 1),
+                    else_=0
+                )), 0)
+            ).select_from(MonthlyBilling).where(
+                MonthlyBilling.billing_year == year,
+                MonthlyBilling.billing_month == month
+            )
+        ).one()
+
+    return (int(active_contracts), int(monthly_billings), int(draft_billings))
+
+
+@st.fragment(run_every=60)
+def render_sidebar_summary(year: int, month: int):
+    """사이드바 현황 요약 렌더링
+
+    fragment로 분리하여 본문 위젯 조작 시 재실행되지 않고 60초마다 갱신된다.
+    fragment는 sidebar에 직접 쓸 수 없으므로 `with st.sidebar:` 안에서 호출한다.
+    """
+    active_contracts, monthly_billings, draft_billings = get_sidebar_counts(year, month)
+
+    st.metric("활성 계약", active_contracts)
+    st.metric(f"{month}월 청구", monthly_billings)
+
+    if draft_billings > 0:
+        st.warning(f"미확정: {draft_billings}건")
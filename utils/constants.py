@@ -28,6 +28,16 @@ class BillingStatus(str, Enum):
     CANCELLED = "cancelled"       # 취소
 
 
+# 청구 대상 계약 상태 (활성 + 계약기간 미확정) - 조회 조건용 값 튜플
+BILLABLE_CONTRACT_STATUSES = (
+    ContractStatus.ACTIVE.value,
+    ContractStatus.PERIOD_UNDEFINED.value,
+)
+
+# 청구 상태 값 (집계 표시 순서)
+BILLING_STATUS_VALUES = tuple(status.value for status in BillingStatus)
+
+
 class CompanyType(str, Enum):
     """업체 유형"""
     SALES = "sales"               # 매출업체 (유지보수 계약업체)
@@ -52,6 +62,15 @@ BILLING_CYCLE_TARGET_MONTHS = {
     BillingCycle.IRREGULAR: [],                 # 비정기는 수동
 }
 
+# 청구주기 문자열 값(DB 저장값) 기준 조회용 - 계약별 Enum 변환 생략
+BILLING_CYCLE_MONTHS_BY_VALUE = {
+    cycle.value: months for cycle, months in BILLING_CYCLE_MONTHS.items()
+}
+# 청구대상월 비트마스크 (bit m 설정 ⇒ m월 청구) - 판정은 시프트/AND 1회
+BILLING_CYCLE_TARGET_MONTH_MASK_BY_VALUE = {
+    cycle.value: sum(1 << m for m in months) for cycle, months in BILLING_CYCLE_TARGET_MONTHS.items()
+}
+
 # 기본 갱신 주기 (개월)
 DEFAULT_RENEWAL_PERIOD_MONTHS = 12
 
@@ -1,22 +1,32 @@
 """날짜 관련 유틸리티 - 사내 표준 규칙 적용"""
 
-import calendar
 from datetime import date, timedelta
-from typing import Optional, List, Tuple
+from functools import lru_cache
+from typing import Collection, NamedTuple, Optional, List, Tuple, Union
 import re
 
 from utils.constants import (
     BillingCycle,
-    BILLING_CYCLE_TARGET_MONTHS,
+    BILLING_CYCLE_TARGET_MONTH_MASK_BY_VALUE,
     BILLING_TIMING_PATTERNS,
     DEFAULT_RENEWAL_PERIOD_MONTHS
 )
 
 
+def _days_in_month(year: int, month: int) -> int:
+    """해당 월의 일수 (폐형식 계산 - calendar.monthrange 대체)
+
+    2월 외에는 30 | ((m ^ (m >> 3)) & 1): 1~7월은 홀수 달, 8~12월은 짝수 달이 31일.
+    """
+    if month == 2:
+        return 29 if is_leap_year(year) else 28
+    return 30 | ((month ^ (month >> 3)) & 1)
+
+
+@lru_cache(maxsize=4096)
 def get_last_day_of_month(year: int, month: int) -> date:
     """해당 월의 마지막 날짜 반환"""
-    last_day = calendar.monthrange(year, month)[1]
-    return date(year, month, last_day)
+    return date(year, month, _days_in_month(year, month))
 
 
 def get_first_day_of_month(year: int, month: int) -> date:
@@ -24,30 +34,30 @@ def get_first_day_of_month(year: int, month: int) -> date:
     return date(year, month, 1)
 
 
+@lru_cache(maxsize=None)
 def is_leap_year(year: int) -> bool:
     """윤년 여부 확인"""
-    return calendar.isleap(year)
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
 
 def add_months(base_date: date, months: int) -> date:
     """월 단위 날짜 더하기 (말일 보정 포함)"""
-    month = base_date.month - 1 + months
-    year = base_date.year + month // 12
-    month = month % 12 + 1
+    # 총 개월 수로 환산 후 divmod 1회로 (년, 월) 복원
+    year, month = divmod(base_date.year * 12 + base_date.month - 1 + months, 12)
+    month += 1
 
     # 말일 보정: 원래 말일이면 새 달도 말일로
-    last_day = calendar.monthrange(year, month)[1]
-    day = min(base_date.day, last_day)
+    day = min(base_date.day, _days_in_month(year, month))
 
     return date(year, month, day)
 
 
-def is_billing_target_month(billing_cycle: BillingCycle, year: int, month: int,
+def is_billing_target_month(billing_cycle: Union[BillingCycle, str], year: int, month: int,
                             custom_months: Optional[List[int]] = None) -> bool:
     """해당 월이 청구 대상 월인지 확인
 
     Args:
-        billing_cycle: 청구 주기
+        billing_cycle: 청구 주기 (BillingCycle 또는 DB 저장 문자열 값)
         year: 연도
         month: 월
         custom_months: 비정기 청구의 경우 직접 지정된 월 목록
@@ -55,8 +65,8 @@ def is_billing_target_month(billing_cycle: BillingCycle, year: int, month: int,
     if billing_cycle == BillingCycle.IRREGULAR:
         return custom_months is not None and month in custom_months
 
-    target_months = BILLING_CYCLE_TARGET_MONTHS.get(billing_cycle, [])
-    return month in target_months
+    cycle_value = getattr(billing_cycle, 'value', billing_cycle)
+    return bool(BILLING_CYCLE_TARGET_MONTH_MASK_BY_VALUE.get(cycle_value, 0) >> month & 1)
 
 
 def calculate_contract_period_status(
@@ -91,12 +101,24 @@ def calculate_contract_period_status(
     if check_date > contract_end:
         if auto_renewal:
             # 자동갱신으로 롤링 계산
-            current_start = contract_start
-            current_end = contract_end
-
-            while current_end < check_date:
-                current_start = add_months(current_start, renewal_period_months)
-                current_end = add_months(current_end, renewal_period_months)
+            if contract_start.day <= 28 and contract_end.day <= 28:
+                # 말일 보정이 생기지 않으므로 갱신 횟수를 바로 계산 (반복 없이 1회 이동)
+                months_needed = (
+                    (check_date.year - contract_end.year) * 12
+                    + check_date.month - contract_end.month
+                    + (check_date.day > contract_end.day)
+                )
+                shift = -(-months_needed // renewal_period_months) * renewal_period_months
+                current_start = add_months(contract_start, shift)
+                current_end = add_months(contract_end, shift)
+            else:
+                # 말일 보정은 회차마다 누적되므로 기존대로 1회차씩 이동
+                current_start = contract_start
+                current_end = contract_end
+
+                while current_end < check_date:
+                    current_start = add_months(current_start, renewal_period_months)
+                    current_end = add_months(current_end, renewal_period_months)
 
             return (True, current_start, current_end, f"자동갱신됨 ({current_start} ~ {current_end})")
         else:
@@ -106,103 +128,119 @@ def calculate_contract_period_status(
     return (False, contract_start, contract_end, "계약 시작 전")
 
 
-def get_previous_business_day(target_date: date, holidays: List[date]) -> date:
+def get_previous_business_day(target_date: date, holidays: Collection[date]) -> date:
     """직전 영업일 반환 (사내 표준: 휴일인 경우 직전 영업일로 보정)
 
     Args:
         target_date: 대상 날짜
-        holidays: 휴일 목록
+        holidays: 휴일 목록 (set/frozenset 권장 - list 등은 set으로 변환 후 조회)
     """
+    if not isinstance(holidays, (set, frozenset)):
+        holidays = frozenset(holidays)
+
     result = target_date
 
-    while result.weekday() >= 5 or result in holidays:  # 토(5), 일(6) 또는 휴일
+    # 토(5)/일(6)은 금요일로 한 번에 이동
+    weekday = result.weekday()
+    if weekday >= 5:
+        result -= timedelta(days=weekday - 4)
+
+    while result in holidays or result.weekday() >= 5:
         result -= timedelta(days=1)
 
     return result
 
 
-def parse_billing_timing(timing_text: str) -> dict:
-    """발행시기 텍스트 파싱
+# 발행시기 파싱 키워드/정규식 (모듈 로드 시 1회 컴파일)
+_REVERSE_BILLING_KEYWORDS = ('역발행', '역발급', '상대발행')
+_MANUAL_TIMING_KEYWORDS = ('요청시', '협의', '별도', '문의', '확인')
+_MULTI_MONTH_RE = re.compile(r'((?:\d+\s*,\s*)+\d+)\s*월')  # "3,6,9,12월"
+_MONTH_RE = re.compile(r'(\d+)\s*월')                       # "6월, 12월"
+_DAY_RE = re.compile(r'(\d+)일')                             # "매월 10일"
+
+
+class BillingTiming(NamedTuple):
+    """발행시기 파싱 결과 (불변 - 캐시 공유 가능, JSON 저장 시 _asdict() 사용)"""
+    parsed: bool
+    day: Union[int, str, None]           # int 또는 'last'
+    months: Optional[Tuple[int, ...]]    # 특정 월만 청구하는 경우
+    is_reverse_billing: bool
+    requires_manual: bool
+    original_text: str
 
-    Returns:
-        {
-            'parsed': bool,
-            'day': int or 'last',
-            'months': List[int] or None (특정 월만 청구하는 경우),
-            'is_reverse_billing': bool,
-            'requires_manual': bool,
-            'original_text': str
-        }
-    """
-    result = {
-        'parsed': False,
-        'day': None,
-        'months': None,
-        'is_reverse_billing': False,
-        'requires_manual': False,
-        'original_text': timing_text
-    }
 
+def _unparsed_timing(timing_text: str) -> BillingTiming:
+    """수동 지정 필요 결과"""
+    return BillingTiming(
+        parsed=False, day=None, months=None,
+        is_reverse_billing=False, requires_manual=True, original_text=timing_text
+    )
+
+
+@lru_cache(maxsize=1024)
+def parse_billing_timing(timing_text: str) -> BillingTiming:
+    """발행시기 텍스트 파싱 (동일 원문은 캐시된 결과 반환)"""
     if not timing_text:
-        result['requires_manual'] = True
-        return result
+        return _unparsed_timing(timing_text)
 
     text = timing_text.strip()
 
     # 역발행 체크
-    if any(kw in text for kw in ['역발행', '역발급', '상대발행']):
-        result['is_reverse_billing'] = True
-        result['parsed'] = True
-        return result
+    if any(kw in text for kw in _REVERSE_BILLING_KEYWORDS):
+        return BillingTiming(
+            parsed=True, day=None, months=None,
+            is_reverse_billing=True, requires_manual=False, original_text=timing_text
+        )
 
     # 수동 지정 필요 키워드
-    manual_keywords = ['요청시', '협의', '별도', '문의', '확인']
-    if any(kw in text for kw in manual_keywords):
-        result['requires_manual'] = True
-        return result
+    if any(kw in text for kw in _MANUAL_TIMING_KEYWORDS):
+        return _unparsed_timing(timing_text)
+
+    parsed = False
+    day = None
+    months = None
 
     # 기본 패턴 매칭
     for pattern, value in BILLING_TIMING_PATTERNS.items():
         if pattern in text:
-            result['day'] = value['day']
-            result['parsed'] = True
+            day = value['day']
+            parsed = True
             break
 
     # 특정 월 패턴 추출 (예: "3,6,9,12월", "6월, 12월")
     # 먼저 "숫자,숫자,...,숫자월" 패턴 시도 (콤마로 연결된 숫자 + 단일 월)
-    multi_month_pattern = r'((?:\d+\s*,\s*)+\d+)\s*월'
-    multi_match = re.search(multi_month_pattern, text)
+    multi_match = _MULTI_MONTH_RE.search(text)
     if multi_match:
         months_str = multi_match.group(1)
-        result['months'] = [int(m.strip()) for m in months_str.split(',')]
+        months = tuple(int(m.strip()) for m in months_str.split(','))
     else:
         # 개별 "N월" 패턴 (예: "6월, 12월")
-        month_pattern = r'(\d+)\s*월'
-        month_matches = re.findall(month_pattern, text)
+        month_matches = _MONTH_RE.findall(text)
         if month_matches:
-            result['months'] = [int(m) for m in month_matches]
+            months = tuple(int(m) for m in month_matches)
 
     # 연 2회 패턴
     if '연 2회' in text or '연2회' in text:
-        result['months'] = result['months'] or [6, 12]
-        result['parsed'] = True
+        months = months or (6, 12)
+        parsed = True
 
     # N일 패턴 (예: "매월 10일")
-    day_pattern = r'(\d+)일'
-    day_match = re.search(day_pattern, text)
-    if day_match and result['day'] is None:
-        result['day'] = int(day_match.group(1))
-        result['parsed'] = True
+    day_match = _DAY_RE.search(text)
+    if day_match and day is None:
+        day = int(day_match.group(1))
+        parsed = True
 
     # 파싱 실패 시 수동 지정 필요
-    if not result['parsed'] and result['day'] is None:
-        result['requires_manual'] = True
+    requires_manual = not parsed and day is None
 
-    return result
+    return BillingTiming(
+        parsed=parsed, day=day, months=months,
+        is_reverse_billing=False, requires_manual=requires_manual, original_text=timing_text
+    )
 
 
 def calculate_billing_date(year: int, month: int, day_spec: any,
-                          holidays: List[date]) -> date:
+                          holidays: Collection[date]) -> date:
     """청구일자 계산 (휴일 보정 포함)
 
     Args:
@@ -214,8 +252,7 @@ def calculate_billing_date(year: int, month: int, day_spec: any,
     if day_spec == 'last':
         target = get_last_day_of_month(year, month)
     else:
-        last_day = calendar.monthrange(year, month)[1]
-        day = min(int(day_spec), last_day)
+        day = min(int(day_spec), _days_in_month(year, month))
         target = date(year, month, day)
 
     # 사내 표준: 휴일인 경우 직전 영업일로 보정
@@ -0,0 +1,14 @@
+"""JSON 유틸리티 - JSON 컬럼 저장용 직렬화"""
+
+import json
+from typing import Any
+
+
+# json.dumps는 기본 옵션이 아니면 호출마다 JSONEncoder를 새로 생성하므로
+# 한글 보존(ensure_ascii=False) 인코더를 모듈 로드 시 1회만 생성해 재사용
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def dumps_json(value: Any) -> str:
+    """JSON 문자열 직렬화 (json.dumps(value, ensure_ascii=False)와 동일 결과)"""
+    return _ENCODER.encode(value)
@@ -2,10 +2,17 @@
 
 import re
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional, List, Tuple, Any
 from decimal import Decimal, InvalidOperation
 
 
+# 셀 값 파싱 캐시 크기 - 불변 결과(tuple/bool)만 반환하는 파서에 적용.
+# 엑셀에는 같은 값이 반복되므로 재파싱 대신 캐시 조회 (typed=True: 1과 1.0 구분)
+_PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE, typed=True)
 def parse_date(value: Any) -> Tuple[Optional[date], str]:
     """날짜 파싱 (다양한 형식 지원)
 
@@ -45,6 +52,7 @@ def parse_date(value: Any) -> Tuple[Optional[date], str]:
     return (None, f"날짜 파싱 실패: {text}")
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE, typed=True)
 def parse_amount(value: Any) -> Tuple[Optional[Decimal], str, Optional[str]]:
     """금액 파싱 (수식 결과 + 원본 보존)
 
@@ -76,6 +84,7 @@ def parse_amount(value: Any) -> Tuple[Optional[Decimal], str, Optional[str]]:
         return (None, f"금액 파싱 실패: {text}", None)
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE, typed=True)
 def parse_boolean(value: Any) -> bool:
     """불리언 파싱 (자동갱신 등)"""
     if value is None:
@@ -97,6 +106,7 @@ def parse_boolean(value: Any) -> bool:
     return True  # 기본값
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE, typed=True)
 def parse_warehouse_code(value: Any) -> Tuple[Optional[str], str]:
     """창고 코드 파싱
 
@@ -219,6 +229,7 @@ def parse_notes_for_rules(notes: str) -> dict:
     return result
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE, typed=True)
 def extract_period_from_item_name(item_name: str) -> Tuple[Optional[int], Optional[str]]:
     """품목명에서 기간 정보 추출 (다개월 선청구 대응)
 